@@ -0,0 +1,29 @@
+"""
+Genesis Studio - Client sharing between agents in one process
+
+Agents running side by side talk to the same 0G Storage sidecar and EigenAI
+endpoint, so an agent built from a peer reuses the peer's clients instead of
+opening its own. The ChaosChain SDK (wallet, signing keys) is never shared.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def peer_kwargs(peer: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Constructor kwargs for an agent built from peer; network and compute provider default to the peer's"""
+    kwargs.setdefault("network", peer.network)
+    kwargs.setdefault("compute_provider", peer.compute_provider_type)
+    kwargs["peer"] = peer
+    return kwargs
+
+
+def shared_storage(peer: Optional[Any]) -> Optional[Any]:
+    """The peer's 0G Storage client, or None when there is none to reuse"""
+    return getattr(peer, "zg_storage", None)
+
+
+def shared_eigenai(peer: Optional[Any], api_key: Optional[str]) -> Optional[Any]:
+    """The peer's EigenAI adapter when it was created with the same API key, else None"""
+    if not api_key or getattr(peer, "eigenai_api_key", None) != api_key:
+        return None
+    return peer.eigenai
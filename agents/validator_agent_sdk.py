@@ -14,6 +14,8 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from rich import print as rprint
 
+from .peer_clients import peer_kwargs, shared_eigenai, shared_storage
+
 # Import ChaosChain SDK components
 try:
     from chaoschain_sdk import ChaosChainAgentSDK, NetworkConfig
@@ -436,7 +438,8 @@ class GenesisValidatorAgentSDK:
                  enable_ap2: bool = True, enable_process_integrity: bool = True,
                  compute_provider: str = "0g",
                  eigenai_api_key: Optional[str] = None,
-                 use_0g_inference: bool = False):
+                 use_0g_inference: bool = False,
+                 peer: Optional[Any] = None):
         """
         Initialize the Genesis Validator Agent with flexible compute providers
         
@@ -450,6 +453,7 @@ class GenesisValidatorAgentSDK:
             compute_provider: Compute provider ("eigenai", "0g", "crewai")
             eigenai_api_key: EigenAI API key (if using eigenai)
             use_0g_inference: DEPRECATED - Use compute_provider="0g" instead
+            peer: Agent whose 0G Storage and EigenAI clients to reuse (see from_peer)
         """
         if not SDK_AVAILABLE:
             raise ImportError("ChaosChain SDK is required for GenesisValidatorAgentSDK")
@@ -471,17 +475,21 @@ class GenesisValidatorAgentSDK:
         )
         
         # Initialize 0G Storage for proof publishing (independent of compute provider)
-        self.zg_storage = None
-        try:
-            from chaoschain_sdk.providers.storage import ZeroGStorageGRPC
-            self.zg_storage = ZeroGStorageGRPC(grpc_url="localhost:50051")
-            if self.zg_storage.is_available:
-                rprint("[cyan]✅ 0G Storage initialized for proof publishing[/cyan]")
-        except Exception as e:
-            rprint(f"[yellow]⚠️  0G Storage not available for proof publishing: {e}[/yellow]")
+        self.zg_storage = shared_storage(peer)
+        if self.zg_storage is not None:
+            rprint(f"[cyan]✅ 0G Storage shared with {peer.agent_name} for proof publishing[/cyan]")
+        else:
+            try:
+                from chaoschain_sdk.providers.storage import ZeroGStorageGRPC
+                self.zg_storage = ZeroGStorageGRPC(grpc_url="localhost:50051")
+                if self.zg_storage.is_available:
+                    rprint("[cyan]✅ 0G Storage initialized for proof publishing[/cyan]")
+            except Exception as e:
+                rprint(f"[yellow]⚠️  0G Storage not available for proof publishing: {e}[/yellow]")
         
         # Initialize compute providers
         self.eigenai = None
+        self.eigenai_api_key = None  # Key the EigenAI adapter was built with, for peers to match
         self.eigencompute = None
         self.zerog_inference = None
         
@@ -503,11 +511,18 @@ class GenesisValidatorAgentSDK:
                 import os
                 from chaoschain_integrations.compute.eigen import EigenComputeAdapter as EigenAIAdapter
                 api_key = eigenai_api_key or os.getenv("EIGEN_API_KEY")
-                if api_key:
+                shared = shared_eigenai(peer, api_key)
+                if shared is not None:
+                    # Same key: reuse the peer's adapter and its pooled HTTP connection
+                    self.eigenai = shared
+                    self.eigenai_api_key = api_key
+                    rprint(f"[green]🔍 EigenAI adapter shared with {peer.agent_name} (TEE-verified LLM)[/green]")
+                elif api_key:
                     self.eigenai = EigenAIAdapter(
                         api_url="https://eigenai.eigencloud.xyz",
                         api_key=api_key
                     )
+                    self.eigenai_api_key = api_key
                     rprint("[green]🔍 EigenAI adapter initialized (TEE-verified LLM)[/green]")
                 else:
                     rprint("[yellow]⚠️  EIGEN_API_KEY not set, falling back to CrewAI[/yellow]")
@@ -569,6 +584,17 @@ class GenesisValidatorAgentSDK:
         else:
             rprint(f"[blue]   Compute: CrewAI (local processing)[/blue]")
     
+    @classmethod
+    def from_peer(cls, peer: Any, agent_name: str, agent_domain: str, **kwargs) -> "GenesisValidatorAgentSDK":
+        """
+        Create a validator next to the agent it validates, reusing that agent's clients
+        
+        Validation proofs go through the peer's 0G Storage client and re-runs
+        through its EigenAI adapter (same API key only); the validator's own
+        ChaosChain SDK still signs the on-chain validation responses.
+        """
+        return cls(agent_name, agent_domain, **peer_kwargs(peer, kwargs))
+    
     def _setup_crewai_agent(self):
         """Setup the CrewAI agent for validation"""
         
@@ -1,6 +1,7 @@
 """Eigen compute adapter implementing ComputeBackend protocol."""
 
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
 from chaoschain_integrations.common.logging import get_logger
@@ -13,6 +14,9 @@ from chaoschain_integrations.compute.eigen.client import EigenComputeClient
 
 logger = get_logger(__name__)
 
+# Job states after which status and result no longer change
+TERMINAL_STATES = frozenset({"completed", "failed"})
+
 
 class EigenComputeAdapter(ComputeBackend):
     """
@@ -20,8 +24,14 @@ class EigenComputeAdapter(ComputeBackend):
 
     This adapter implements the ComputeBackend protocol using Eigen's
     TEE-based ML inference service.
+
+    Statuses and results of jobs that reached a terminal state are
+    immutable, so the adapter keeps the most recent ones in memory and
+    answers repeat lookups without another round-trip.
     """
 
+    CACHE_SIZE = 128
+
     def __init__(
         self,
         *,
@@ -46,8 +56,24 @@ class EigenComputeAdapter(ComputeBackend):
             timeout_seconds=timeout_seconds,
         )
         self.default_timeout = timeout_seconds or 600
+        self._terminal_status: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._results: "OrderedDict[str, ComputeResult]" = OrderedDict()
         logger.info("eigen_compute_adapter_initialized")
 
+    def _remember(self, cache: OrderedDict, job_id: str, value: Any) -> None:
+        """Store value for job_id, evicting the least recently used entry."""
+        cache[job_id] = value
+        cache.move_to_end(job_id)
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _cached(self, cache: OrderedDict, job_id: str) -> Any:
+        """Return the cached value for job_id (marking it recently used) or None."""
+        value = cache.get(job_id)
+        if value is not None:
+            cache.move_to_end(job_id)
+        return value
+
     def submit(self, task: Dict[str, Any]) -> str:
         """Submit compute job to Eigen."""
         logger.info("eigen_compute_submit_start", task=task.get("task"))
@@ -60,6 +86,10 @@ class EigenComputeAdapter(ComputeBackend):
 
     def status(self, job_id: str) -> Dict[str, Any]:
         """Get job status."""
+        cached = self._cached(self._terminal_status, job_id)
+        if cached is not None:
+            return dict(cached)
+
         logger.info("eigen_compute_status_check", job_id=job_id)
 
         response = self.client.get_status_sync(job_id)
@@ -78,7 +108,10 @@ class EigenComputeAdapter(ComputeBackend):
             status=response.status,
         )
 
-        return status_dict
+        if response.status in TERMINAL_STATES:
+            self._remember(self._terminal_status, job_id, status_dict)
+
+        return dict(status_dict)
 
     def result(
         self,
@@ -88,6 +121,10 @@ class EigenComputeAdapter(ComputeBackend):
         timeout_s: int = 300,
     ) -> ComputeResult:
         """Get job result with proof."""
+        cached = self._cached(self._results, job_id)
+        if cached is not None:
+            return cached
+
         logger.info("eigen_compute_result_start", job_id=job_id, wait=wait)
 
         timeout = timeout_s or self.default_timeout
@@ -96,8 +133,7 @@ class EigenComputeAdapter(ComputeBackend):
         if wait:
             start_time = time.time()
             while time.time() - start_time < timeout:
-                status = self.client.get_status_sync(job_id)
-                if status.status in ("completed", "failed"):
+                if self.status(job_id)["status"] in TERMINAL_STATES:
                     break
                 time.sleep(1.0)
 
@@ -129,6 +165,9 @@ class EigenComputeAdapter(ComputeBackend):
             status=response.status,
         )
 
+        if response.status in TERMINAL_STATES:
+            self._remember(self._results, job_id, result)
+
         return result
 
     def cancel(self, job_id: str) -> bool:
@@ -145,3 +184,7 @@ class EigenComputeAdapter(ComputeBackend):
 
         return response.cancelled
 
+    def close(self) -> None:
+        """Release the client's pooled HTTP connections."""
+        self.client.close()
+
@@ -6,9 +6,11 @@ Based on EigenCloud documentation: https://docs.eigencloud.xyz/
 """
 
 import asyncio
+import importlib.util
 import json
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NoReturn, Optional, Tuple
 from enum import Enum
 
 import httpx
@@ -31,6 +33,9 @@ from chaoschain_integrations.compute.eigen.schemas import (
 
 logger = get_logger(__name__)
 
+# HTTP/2 multiplexing needs the optional ``h2`` package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class EigenComputeClient:
     """
@@ -38,6 +43,10 @@ class EigenComputeClient:
     
     EigenCloud provides TEE-based AI inference with verifiable compute.
     API Documentation: https://docs.eigencloud.xyz/products/eigencompute/
+
+    The synchronous wrappers share one keep-alive ``httpx.Client`` (HTTP/2
+    when ``h2`` is installed), so repeated requests reuse the same TLS
+    connection. Call ``close()`` to release it.
     """
 
     # EigenAI API endpoints (OpenAI-compatible)
@@ -87,6 +96,9 @@ class EigenComputeClient:
         # Job cache for status/result queries (since EigenAI is synchronous)
         self._job_cache: Dict[str, Dict[str, Any]] = {}
 
+        # Pooled HTTP client for the sync wrappers, created on first use
+        self._http: Optional[httpx.Client] = None
+
         logger.info(
             "eigenai_client_init",
             api_url=self.api_url,
@@ -120,6 +132,21 @@ class EigenComputeClient:
             ConnectionError: If request fails
             TimeoutError: If request times out
         """
+        timeout, payload = self._prepare_submit(task, timeout_s)
+
+        with self._translate_http_errors(timeout):
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                response = await client.post(
+                    f"{self.api_url}{self.CHAT_COMPLETIONS_ENDPOINT}",
+                    headers=self.headers,
+                    json=payload,
+                )
+            return self._handle_submit_response(response)
+
+    def _prepare_submit(
+        self, task: Dict[str, Any], timeout_s: Optional[int]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Resolve the timeout, log the request and build the chat payload for a submit."""
         timeout = timeout_s or self.timeout
 
         logger.info(
@@ -129,61 +156,60 @@ class EigenComputeClient:
         )
 
         # Format payload for EigenAI Chat Completions API
-        payload = self._format_chat_payload(task)
+        return timeout, self._format_chat_payload(task)
 
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{self.api_url}{self.CHAT_COMPLETIONS_ENDPOINT}",
-                    headers=self.headers,
-                    json=payload,
-                )
+    def _handle_submit_response(self, response: httpx.Response) -> EigenSubmitResponse:
+        """Validate a chat completion response and cache it under its job ID."""
+        if response.status_code == 401 or response.status_code == 403:
+            raise AuthenticationError(
+                "Invalid EigenAI API key",
+                adapter_name="eigen",
+                details={"status_code": response.status_code},
+            )
 
-                if response.status_code == 401 or response.status_code == 403:
-                    raise AuthenticationError(
-                        "Invalid EigenAI API key",
-                        adapter_name="eigen",
-                        details={"status_code": response.status_code},
-                    )
-
-                if response.status_code == 400:
-                    error_detail = response.json().get("error", "Invalid request")
-                    raise ValidationError(
-                        f"Invalid task format: {error_detail}",
-                        adapter_name="eigen",
-                        details=response.json(),
-                    )
-
-                response.raise_for_status()
-                data = response.json()
-
-                # Use EigenAI's real job ID (not generated locally!)
-                job_id = data.get("id", f"eigen_fallback_{int(time.time())}")
-
-                # Cache the result for status/result queries
-                self._job_cache[job_id] = {
-                    "status": "completed",
-                    "output": data,
-                    "created_at": data.get("created", int(time.time())),
-                    "completed_at": data.get("created", int(time.time())),
-                }
-
-                result = EigenSubmitResponse(
-                    job_id=job_id,  # Real EigenAI job ID
-                    status="completed",  # EigenAI returns immediately
-                    created_at=data.get("created", int(time.time())),
-                )
+        if response.status_code == 400:
+            error_detail = response.json().get("error", "Invalid request")
+            raise ValidationError(
+                f"Invalid task format: {error_detail}",
+                adapter_name="eigen",
+                details=response.json(),
+            )
 
-                logger.info(
-                    "eigenai_chat_completion_success",
-                    job_id=job_id,
-                    model=data.get("model"),
-                )
+        response.raise_for_status()
+        data = response.json()
 
-                return result
+        # Use EigenAI's real job ID (not generated locally!)
+        job_id = data.get("id", f"eigen_fallback_{int(time.time())}")
+
+        # Cache the result for status/result queries
+        self._job_cache[job_id] = {
+            "status": "completed",
+            "output": data,
+            "created_at": data.get("created", int(time.time())),
+            "completed_at": data.get("created", int(time.time())),
+        }
 
+        result = EigenSubmitResponse(
+            job_id=job_id,  # Real EigenAI job ID
+            status="completed",  # EigenAI returns immediately
+            created_at=data.get("created", int(time.time())),
+        )
+
+        logger.info(
+            "eigenai_chat_completion_success",
+            job_id=job_id,
+            model=data.get("model"),
+        )
+
+        return result
+
+    @contextmanager
+    def _translate_http_errors(self, timeout: int) -> Iterator[None]:
+        """Map httpx timeouts and HTTP errors to integration errors."""
+        try:
+            yield
         except httpx.TimeoutException as e:
-            logger.error("eigenai_timeout", timeout=timeout, job_id=job_id)
+            logger.error("eigenai_timeout", timeout=timeout)
             raise TimeoutError(
                 f"Request timed out after {timeout}s",
                 adapter_name="eigen",
@@ -195,7 +221,6 @@ class EigenComputeClient:
                 "eigenai_error",
                 status_code=e.response.status_code,
                 error=str(e),
-                job_id=job_id,
             )
             raise ConnectionError(
                 f"EigenAI API error: {e}",
@@ -203,6 +228,23 @@ class EigenComputeClient:
                 details={"status_code": e.response.status_code},
             ) from e
 
+    def _get_http(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.Client(
+                headers=self.headers,
+                timeout=httpx.Timeout(self.timeout, connect=5),
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._http
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
     async def get_status(
         self,
         job_id: str,
@@ -369,26 +411,34 @@ class EigenComputeClient:
                     f"{self.api_url}{self.MODELS_ENDPOINT}",
                     headers=self.headers,
                 )
+            return self._handle_models_response(response)
 
-                response.raise_for_status()
-                data = response.json()
+        except httpx.HTTPStatusError as e:
+            self._raise_list_models_error(e)
 
-                logger.info(
-                    "eigen_compute_list_models_success",
-                    model_count=len(data.get("models", [])),
-                )
+    def _handle_models_response(self, response: httpx.Response) -> List[Dict[str, Any]]:
+        """Extract the model list from a /v1/models response."""
+        response.raise_for_status()
+        data = response.json()
 
-                return data.get("models", [])
+        logger.info(
+            "eigen_compute_list_models_success",
+            model_count=len(data.get("models", [])),
+        )
 
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                "eigen_compute_list_models_error",
-                status_code=e.response.status_code,
-            )
-            raise ConnectionError(
-                f"Failed to list models: {e}",
-                adapter_name="eigen",
-            ) from e
+        return data.get("models", [])
+
+    @staticmethod
+    def _raise_list_models_error(e: httpx.HTTPStatusError) -> NoReturn:
+        """Log and re-raise a /v1/models HTTP error as ConnectionError."""
+        logger.error(
+            "eigen_compute_list_models_error",
+            status_code=e.response.status_code,
+        )
+        raise ConnectionError(
+            f"Failed to list models: {e}",
+            adapter_name="eigen",
+        ) from e
 
     def _format_chat_payload(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -443,8 +493,16 @@ class EigenComputeClient:
         task: Dict[str, Any],
         timeout_s: Optional[int] = None,
     ) -> EigenSubmitResponse:
-        """Synchronous wrapper for submit_job."""
-        return asyncio.run(self.submit_job(task, timeout_s))
+        """Synchronous submit_job over the pooled connection."""
+        timeout, payload = self._prepare_submit(task, timeout_s)
+
+        with self._translate_http_errors(timeout):
+            response = self._get_http().post(
+                f"{self.api_url}{self.CHAT_COMPLETIONS_ENDPOINT}",
+                json=payload,
+                timeout=timeout,
+            )
+            return self._handle_submit_response(response)
 
     def get_status_sync(
         self,
@@ -471,6 +529,16 @@ class EigenComputeClient:
         return asyncio.run(self.cancel_job(job_id, timeout_s))
 
     def list_models_sync(self, timeout_s: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Synchronous wrapper for list_models."""
-        return asyncio.run(self.list_models(timeout_s))
+        """Synchronous list_models over the pooled connection."""
+        timeout = timeout_s or self.timeout
+
+        try:
+            response = self._get_http().get(
+                f"{self.api_url}{self.MODELS_ENDPOINT}",
+                timeout=timeout,
+            )
+            return self._handle_models_response(response)
+
+        except httpx.HTTPStatusError as e:
+            self._raise_list_models_error(e)
 
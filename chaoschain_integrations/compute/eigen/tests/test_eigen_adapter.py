@@ -1,9 +1,11 @@
 """Unit tests for Eigen compute adapter."""
 
+import httpx
 import pytest
 from unittest.mock import MagicMock, patch
 
 from chaoschain_integrations.compute.eigen.adapter import EigenComputeAdapter
+from chaoschain_integrations.compute.eigen.client import HTTP2_AVAILABLE, EigenComputeClient
 from chaoschain_integrations.compute.eigen.schemas import (
     EigenSubmitResponse,
     EigenStatusResponse,
@@ -104,6 +106,41 @@ def test_eigen_compute_result(mock_eigen_client):
     mock_eigen_client.get_result_sync.assert_called_once()
 
 
+@pytest.mark.unit
+def test_eigen_compute_terminal_status_and_result_cached(mock_eigen_client):
+    """Test completed jobs are answered from memory on repeat lookups."""
+    adapter = EigenComputeAdapter()
+    job_id = "eigen_job_456"
+
+    first = adapter.status(job_id)
+    first["status"] = "mutated"
+    assert adapter.status(job_id)["status"] == "completed"
+    mock_eigen_client.get_status_sync.assert_called_once()
+
+    result = adapter.result(job_id, wait=True)
+    assert adapter.result(job_id) is result
+    mock_eigen_client.get_status_sync.assert_called_once()
+    mock_eigen_client.get_result_sync.assert_called_once()
+
+
+@pytest.mark.unit
+def test_eigen_compute_pending_status_not_cached(mock_eigen_client):
+    """Test non-terminal statuses are always re-fetched."""
+    mock_eigen_client.get_status_sync.return_value = EigenStatusResponse(
+        job_id="eigen_job_456",
+        status="running",
+        progress=50,
+        error=None,
+        updated_at=1234567890,
+    )
+    adapter = EigenComputeAdapter()
+
+    adapter.status("eigen_job_456")
+    adapter.status("eigen_job_456")
+
+    assert mock_eigen_client.get_status_sync.call_count == 2
+
+
 @pytest.mark.unit
 def test_eigen_compute_cancel(mock_eigen_client):
     """Test job cancellation."""
@@ -116,6 +153,44 @@ def test_eigen_compute_cancel(mock_eigen_client):
     mock_eigen_client.cancel_job_sync.assert_called_once()
 
 
+@pytest.mark.unit
+def test_eigen_client_sync_calls_share_pooled_connection():
+    """Test sync submits reuse one pooled HTTP client."""
+    requests = []
+    real_client = httpx.Client
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": f"chatcmpl-{len(requests)}", "created": 1})
+
+    def mock_transport_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    client = EigenComputeClient(api_key="sk-test")
+    assert client._http is None
+
+    with patch(
+        "chaoschain_integrations.compute.eigen.client.httpx.Client",
+        side_effect=mock_transport_client,
+    ) as client_cls:
+        first = client.submit_job_sync({"prompt": "a"})
+        second = client.submit_job_sync({"prompt": "b"})
+        pooled = client._get_http()
+
+    client_cls.assert_called_once()
+    options = client_cls.call_args.kwargs
+    assert options["http2"] is HTTP2_AVAILABLE
+    assert options["limits"].max_keepalive_connections == 16
+    assert options["limits"].max_connections == 32
+    assert (first.job_id, second.job_id) == ("chatcmpl-1", "chatcmpl-2")
+    assert requests[0].headers["X-API-Key"] == "sk-test"
+    assert client.get_status_sync("chatcmpl-2").status == "completed"
+
+    client.close()
+    assert pooled.is_closed
+    assert client._http is None
+
+
 @pytest.mark.contract
 def test_eigen_compute_adapter_contract(mock_eigen_client):
     """Test Eigen compute adapter conforms to ComputeBackend contract."""
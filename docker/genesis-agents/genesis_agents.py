@@ -13,6 +13,11 @@ from typing import Dict, Any
 import httpx
 from flask import Flask, request, jsonify
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib decoder
+
 # EigenAI configuration
 EIGENAI_API_URL = os.getenv("EIGEN_API_URL", "https://eigenai.eigencloud.xyz")
 EIGENAI_API_KEY = os.getenv("EIGEN_API_KEY")
@@ -60,6 +65,21 @@ def call_eigenai(prompt: str, seed: int = 42) -> dict:
         return response.json()
 
 
+def parse_json(content: str) -> Any:
+    """
+    Decode model output JSON, with orjson's C decoder when installed
+    
+    Deliberately schema-free (not a msgspec.Struct): the model may add keys and
+    callers extend the result dict, and both feed the execution hash.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib decoder accept (or reject) what orjson won't, e.g. NaN
+    return json.loads(content)
+
+
 # ============================================================================
 # ALICE - LOAN OFFICER AGENT
 # ============================================================================
@@ -125,13 +145,13 @@ Be conservative but fair. Consider all factors holistically."""
     
     # Parse JSON
     try:
-        evaluation = json.loads(content)
+        evaluation = parse_json(content)
     except json.JSONDecodeError:
         if "```json" in content:
             start = content.find("```json") + 7
             end = content.find("```", start)
             content = content[start:end].strip()
-            evaluation = json.loads(content)
+            evaluation = parse_json(content)
         else:
             # Fallback: Conservative rejection
             evaluation = {
@@ -232,13 +252,13 @@ Provide JSON audit with:
     
     # Parse JSON
     try:
-        audit = json.loads(content)
+        audit = parse_json(content)
     except json.JSONDecodeError:
         if "```json" in content:
             start = content.find("```json") + 7
             end = content.find("```", start)
             content = content[start:end].strip()
-            audit = json.loads(content)
+            audit = parse_json(content)
         else:
             # Fallback: Conservative audit
             audit = {
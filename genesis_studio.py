@@ -145,27 +145,43 @@ print(f"✅ Feedback with payment proof submitted: {tx_hash}")
 import os
 import sys
 import json
+import logging
+import re
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional
-from rich.panel import Panel
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+from operator import attrgetter
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib encoder
 
 # Add integrations to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "chaoschain-integrations"))
 
+import httpx
 from dotenv import load_dotenv
 from rich import print as rprint
 from rich.panel import Panel
 from rich.align import Align
 from rich.table import Table
+from rich.console import Group
+from rich.text import Text
 from chaoschain_sdk import ChaosChainAgentSDK, NetworkConfig
-from chaoschain_sdk.types import AgentRole
+from chaoschain_sdk.types import AgentRole, PaymentMethod, PaymentProof
 
 # Import agents
 from agents.server_agent_sdk import GenesisServerAgentSDK
 from agents.validator_agent_sdk import GenesisValidatorAgentSDK
 from agents.client_agent_genesis import GenesisClientAgent
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -186,10 +202,177 @@ if not os.getenv("0G-TESTNET_CHAIN_ID"):
     os.environ["0G-TESTNET_CHAIN_ID"] = "16600"
     print("✅ Using default 0G Testnet Chain ID: 16600")
 
+
+def _json_default(obj: Any) -> Any:
+    """Make SDK objects (enums, datetimes, dataclasses, plain objects) JSON-encodable
+    
+    Enums and datetimes are encoded the way orjson encodes them natively, so the
+    bytes (and the content keys derived from them) don't depend on orjson.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    return str(obj)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Compact JSON encoding (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    """Read a field from either a dict or an SDK object without hasattr probing"""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+def _x402_receipt(payment: Any) -> Dict[str, Any]:
+    """Receipt dict for an x402 PaymentProof as embedded in evidence packages"""
+    return {
+        "payment_id": payment.payment_id,
+        "transaction_hash": payment.transaction_hash,
+        "amount": payment.amount,
+        "currency": payment.currency,
+        "payment_method": str(payment.payment_method)
+    }
+
+
+# ```json ... ``` fence around LLM JSON output
+_JSON_FENCE = re.compile(r"```json\s*([\s\S]*?)```")
+
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _content_key(prefix: str, payload: bytes) -> str:
+    """Content-addressed idempotency key so identical uploads dedupe in the sidecar"""
+    return f"{prefix}_{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+@dataclass(frozen=True)
+class AliceEvidence:
+    """Fixed-shape evidence record Alice uploads to 0G Storage"""
+    type: str = "genesis_studio_evidence"
+    agent: str = "Alice"
+    role: str = "server"
+    service: str = "smart_shopping_analysis"
+    timestamp: str = ""
+    analysis: Dict[str, Any] = field(default_factory=dict)
+    process_integrity_proof: Any = None
+    network: str = "0G Testnet"
+
+
+EXPLORER_TX_URL = "https://chainscan-galileo.0g.ai/tx/"
+
+
+def _hex0x(h: str) -> str:
+    """Normalize a hex string to carry exactly one 0x prefix"""
+    return h if h[:2] == "0x" else "0x" + h
+
+
+def _explorer_url(tx_hash: str) -> str:
+    """0G Galileo explorer link for a transaction hash"""
+    return EXPLORER_TX_URL + _hex0x(tx_hash)
+
+
+# Where each recorded x402 payment lives in the orchestrator results; keep path
+# knowledge here so a results layout change is a single-site edit
+def _analysis_x402_payment(results: Dict[str, Any]) -> Any:
+    return ((results.get("analysis") or {}).get("dual_payment") or {}).get("x402_payment_result")
+
+
+def _validation_x402_payment(results: Dict[str, Any]) -> Any:
+    return (results.get("validation") or {}).get("x402_payment")
+
+
+_receipt_data = attrgetter("receipt_data")
+
+
+# Shared report markup fragments
+_SEP60 = "=" * 60
+_OK = "[green]✅ SUCCESS[/green]"
+
+
+# Constant sections of the x402 monitoring report, markup parsed once at import
+_PROTOCOL_VERIFICATION_BLOCK = Text.from_markup(
+    "\n[bold green]🔍 x402 Protocol Verification[/bold green]\n"
+    "   Protocol: x402 v0.2.1+ (Coinbase Official)\n"
+    "   Network: 0g-testnet\n"
+    "   Treasury: 0x20E7B2A2c8969725b88Dd3EF3a11Bc3353C83F70\n"
+    "   Protocol Fee: 2.5%\n"
+    "   Currency: A0GI (0G native tokens)\n"
+    "   Settlement Mode: Direct A0GI transfers (2 transactions per payment)"
+)
+_BENEFITS_BLOCK = Text.from_markup(
+    "\n[bold green]🎯 x402 Benefits Demonstrated[/bold green]\n"
+    "   ✅ Frictionless agent-to-agent payments in A0GI\n"
+    "   ✅ Cryptographic payment receipts for PoA\n"
+    "   ✅ Dual-transaction architecture (fee + payment)\n"
+    "   ✅ Automatic protocol fee collection (2.5% to ChaosChain)\n"
+    "   ✅ Enhanced evidence packages with payment proofs\n"
+    "   ✅ Production-ready A0GI settlement on 0G Testnet\n"
+    "   ✅ Native integration with 0G Compute & Storage"
+)
+
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Environment-derived settings, read once per orchestrator"""
+    network: Optional[str]
+    rpc_url: str
+    compute_provider: str
+    eigen_api_key: Optional[str]
+    eigencompute_app_id: Optional[str]
+    quiet: bool
+    
+    @classmethod
+    def from_env(cls) -> "RuntimeConfig":
+        env = os.environ
+        return cls(
+            network=env.get("NETWORK"),
+            rpc_url=env["0G-TESTNET_RPC_URL"],
+            compute_provider=env.get("COMPUTE_PROVIDER", "0g").lower(),
+            eigen_api_key=env.get("EIGEN_API_KEY"),
+            eigencompute_app_id=env.get("EIGENCOMPUTE_APP_ID"),
+            quiet=env.get("GENESIS_QUIET") == "1",
+        )
+
+
+# Resolved once at import, after the 0G env defaults above have been applied
+RUNTIME_CONFIG = RuntimeConfig.from_env()
+
+
 class GenesisStudioX402Orchestrator:
     """Enhanced Genesis Studio orchestrator with x402 payment integration"""
     
-    def __init__(self):
+    # Cart mandates expire after 15 minutes; stop reusing them with a safety margin
+    MANDATE_REUSE_SECONDS = 10 * 60
+    
+    def __init__(self, cfg: Optional[RuntimeConfig] = None):
+        self.cfg = cfg or RUNTIME_CONFIG
+        
+        # Per-item detail output (status polls, per-agent listings) only on interactive runs
+        self.verbose = sys.stdout.isatty() and not self.cfg.quiet
+        
+        # Pooled keep-alive HTTP client shared by RPC/faucet helpers
+        self.http = httpx.Client(
+            transport=httpx.HTTPTransport(retries=3),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            timeout=15.0,
+        )
+        
         # Track results for final summary
         self.results = {}
         
@@ -197,6 +380,47 @@ class GenesisStudioX402Orchestrator:
         self.alice_sdk = None  # Server Agent
         self.bob_sdk = None    # Validator Agent
         self.charlie_sdk = None # Client Agent
+        
+        # Signed AP2 mandates reused while still valid: (created_at, intent, cart, verified)
+        self._mandate_cache: Optional[tuple] = None
+        
+        # Resolved ERC-8004 agent IDs by agent name (registered agents only)
+        self._agent_ids: Dict[str, Any] = {}
+        
+        # Analysis CID (or data repr) -> 0x-prefixed SHA-256 used as the ERC-8004 data hash
+        self._data_hash_cache: Dict[str, str] = {}
+        
+        # Content key -> results entry for evidence already uploaded this session
+        self._storage_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Per-phase serialization cache: id(obj) -> (obj, encoded bytes)
+        self._ser_cache: Dict[int, tuple] = {}
+        
+        # Payment entries resolved from results for the end-of-run summaries
+        self._cached_payment_view: Optional[Dict[str, Any]] = None
+        self._payment_aggregates: Optional[Dict[str, Any]] = None
+        
+        # id(payment) -> (payment, (short tx hash, short payment id)) for summary rows
+        self._short_id_cache: Dict[int, tuple] = {}
+    
+    def _ser(self, obj: Any) -> bytes:
+        """Encode obj as compact JSON once per phase, reusing the bytes on later calls"""
+        cached = self._ser_cache.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        encoded = _json_bytes(obj)
+        # Keep a reference to obj so its id() cannot be recycled while cached
+        self._ser_cache[id(obj)] = (obj, encoded)
+        return encoded
+    
+    def _short_ids(self, payment: Any) -> tuple:
+        """20-char transaction hash and payment ID prefixes for display, cut once per payment"""
+        cached = self._short_id_cache.get(id(payment))
+        if cached is not None and cached[0] is payment:
+            return cached[1]
+        short = ((getattr(payment, "transaction_hash", "") or "")[:20], (getattr(payment, "payment_id", "") or "")[:20])
+        self._short_id_cache[id(payment)] = (payment, short)
+        return short
     
     def run_complete_demo(self):
         """Execute the complete Genesis Studio x402 demonstration"""
@@ -215,7 +439,7 @@ class GenesisStudioX402Orchestrator:
             
             
             # Final Summary
-            self._display_final_summary()
+            self._render_report()
             
         except KeyboardInterrupt:
             rprint("[yellow]⚠️  Demo interrupted by user[/yellow]")
@@ -226,6 +450,8 @@ class GenesisStudioX402Orchestrator:
             traceback.print_exc()
             rprint(f"[red]❌ Demo failed with unexpected error: {e}[/red]")
             sys.exit(1)
+        finally:
+            self.http.close()
     
     def _print_banner(self):
         """Print Genesis Studio banner"""
@@ -351,11 +577,13 @@ class GenesisStudioX402Orchestrator:
         rprint("\n[blue]🔧 Step 12: Storing enhanced evidence package on 0G Storage...[/blue]")
         enhanced_evidence_cid = self._store_enhanced_evidence_package(alice_evidence_package)
         rprint("[green]✅ Enhanced evidence package stored[/green]")
+        
+        self._ser_cache.clear()
     
     
     def _validate_configuration(self):
         """Validate all required environment variables including x402"""
-        network = os.getenv("NETWORK", "base-sepolia")
+        network = self.cfg.network or "base-sepolia"
         
         # Core required variables (network-specific)
         if network == "0g-testnet":
@@ -396,7 +624,7 @@ class GenesisStudioX402Orchestrator:
             rprint("[yellow]   To enable Pinata: set PINATA_JWT and PINATA_GATEWAY[/yellow]")
         
         # Validate network is set to 0g-testnet
-        if os.getenv("NETWORK") != "0g-testnet":
+        if self.cfg.network != "0g-testnet":
             rprint("[yellow]⚠️  Network is not set to '0g-testnet'. This demo is designed for 0G Testnet.[/yellow]")
     
     def _initialize_agent_sdks(self):
@@ -406,7 +634,7 @@ class GenesisStudioX402Orchestrator:
         rprint("[yellow]🤖 Initializing CrewAI-powered agents with ChaosChain SDK...[/yellow]")
         
         # Read compute provider from environment
-        compute_provider = os.getenv("COMPUTE_PROVIDER", "0g").lower()
+        compute_provider = self.cfg.compute_provider
         
         # Display chosen provider
         if compute_provider == "eigenai":
@@ -424,40 +652,61 @@ class GenesisStudioX402Orchestrator:
         
         # Initialize 0G storage for all providers (for data layer)
         # Uses gRPC sidecar (more reliable than CLI)
-        try:
-            rprint("[cyan]   Initializing 0G Storage via gRPC sidecar...[/cyan]")
+        rprint("[cyan]   Initializing 0G Storage via gRPC sidecar...[/cyan]")
+        # The SDK clients run their sidecar health check RPC in the constructor, so
+        # build both concurrently: the connection round trips overlap and each
+        # channel is already warm for the first real put/submit
+        def connect_storage():
             from chaoschain_sdk.providers.storage import ZeroGStorageGRPC
-            self.zg_storage = ZeroGStorageGRPC(grpc_url="localhost:50051")
-            if self.zg_storage.is_available:
-                rprint("[green]✅ 0G Storage gRPC sidecar connected[/green]")
-                rprint("[cyan]   Using 0G Storage sidecar on localhost:50051[/cyan]")
-            else:
-                rprint("[yellow]⚠️  0G Storage sidecar not available[/yellow]")
-                rprint("[yellow]📘 Starting 0G sidecar automatically...[/yellow]")
-                self.zg_storage = None
-        except Exception as e:
-            rprint(f"[yellow]⚠️  0G Storage sidecar not available: {e}[/yellow]")
+            return ZeroGStorageGRPC(grpc_url="localhost:50051")
+        
+        def connect_compute():
+            from chaoschain_sdk.providers.compute import ZeroGComputeGRPC
+            return ZeroGComputeGRPC(grpc_url="localhost:50051")
+        
+        def connect(factory):
+            client = factory()
+            return client, bool(client.is_available)
+        
+        storage_client = compute_client = None
+        storage_ok = compute_ok = False
+        storage_error = compute_error = None
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            storage_future = pool.submit(connect, connect_storage)
+            compute_future = pool.submit(connect, connect_compute) if compute_provider == "0g" else None
+            try:
+                storage_client, storage_ok = storage_future.result()
+            except Exception as e:
+                storage_error = e
+            if compute_future is not None:
+                try:
+                    compute_client, compute_ok = compute_future.result()
+                except Exception as e:
+                    compute_error = e
+        
+        self.zg_storage = storage_client if storage_ok else None
+        if storage_ok:
+            rprint("[green]✅ 0G Storage gRPC sidecar connected[/green]")
+            rprint("[cyan]   Using 0G Storage sidecar on localhost:50051[/cyan]")
+        else:
+            suffix = f": {storage_error}" if storage_error else ""
+            rprint(f"[yellow]⚠️  0G Storage sidecar not available{suffix}[/yellow]")
             rprint("[yellow]📘 Starting 0G sidecar automatically...[/yellow]")
-            self.zg_storage = None
         
         # Initialize compute provider
         if compute_provider == "0g":
-            try:
-                from chaoschain_sdk.providers.compute import ZeroGComputeGRPC, VerificationMethod
-                
-                self.zg_compute = ZeroGComputeGRPC(grpc_url="localhost:50051")
-                
-                if self.zg_compute.is_available:
+            if compute_error is not None:
+                rprint(f"[yellow]⚠️  0G Compute not available: {compute_error}[/yellow]")
+                rprint("[yellow]   Will use CrewAI fallback for compute[/yellow]")
+                self.zg_compute = None
+            else:
+                self.zg_compute = compute_client
+                if compute_ok:
                     rprint("[green]✅ 0G Compute gRPC service available[/green]")
                     self.compute_provider = self.zg_compute
                     self.compute_provider_name = "0G Compute"
                 else:
                     rprint("[yellow]⚠️  0G Compute gRPC service not available[/yellow]")
-                
-            except Exception as e:
-                rprint(f"[yellow]⚠️  0G Compute not available: {e}[/yellow]")
-                rprint("[yellow]   Will use CrewAI fallback for compute[/yellow]")
-                self.zg_compute = None
         
         # Display active compute provider
         rprint(f"[bold green]🔧 Active Compute Provider: {compute_provider.upper()}[/bold green]")
@@ -476,7 +725,7 @@ class GenesisStudioX402Orchestrator:
             enable_ap2=True,
             enable_process_integrity=True,
             compute_provider=compute_provider,
-            eigenai_api_key=os.getenv("EIGEN_API_KEY")
+            eigenai_api_key=self.cfg.eigen_api_key
         )
         rprint("[green]   Alice agent created![/green]")
         
@@ -489,7 +738,7 @@ class GenesisStudioX402Orchestrator:
             enable_ap2=True,
             enable_process_integrity=True,
             compute_provider=compute_provider,
-            eigenai_api_key=os.getenv("EIGEN_API_KEY")
+            eigenai_api_key=self.cfg.eigen_api_key
         )
         rprint("[green]   Bob agent created![/green]")
         
@@ -511,6 +760,9 @@ class GenesisStudioX402Orchestrator:
         
         # Display agent status
         for name, agent in [("Alice", self.alice_agent), ("Bob", self.bob_agent), ("Charlie", self.charlie_agent)]:
+            if not self.verbose:
+                print(f"✅ {name} CrewAI Agent initialized")
+                continue
             rprint(f"✅ {name} CrewAI Agent initialized:")
             rprint(f"   Agent Name: {agent.agent_name}")
             rprint(f"   Agent Domain: {agent.agent_domain}")
@@ -528,6 +780,32 @@ class GenesisStudioX402Orchestrator:
             "Charlie": self.charlie_sdk.wallet_address
         }
     
+    def _batch_get_balances(self, addresses: List[str]) -> List[int]:
+        """Fetch wei balances for all addresses in one batched eth_getBalance JSON-RPC call"""
+        
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_getBalance", "params": [address, "latest"]}
+            for i, address in enumerate(addresses)
+        ]
+        response = self.http.post(self.cfg.rpc_url, json=batch)
+        response.raise_for_status()
+        
+        # Servers may answer batch entries in any order
+        by_id = {item["id"]: item for item in response.json()}
+        return [int(by_id[i]["result"], 16) for i in range(len(addresses))]
+    
+    def _agent_id(self, name: str) -> Optional[Any]:
+        """On-chain agent ID for Alice/Bob/Charlie, resolved once and then cached"""
+        
+        agent_id = self._agent_ids.get(name)
+        if agent_id is None:
+            sdk = {"Alice": self.alice_sdk, "Bob": self.bob_sdk, "Charlie": self.charlie_sdk}[name]
+            agent_id = sdk.get_agent_id()
+            # Unregistered agents resolve to None; keep asking until they register
+            if agent_id is not None:
+                self._agent_ids[name] = agent_id
+        return agent_id
+    
     def _fund_agent_wallets(self):
         """Fund all agent wallets from 0G Testnet faucet"""
         
@@ -535,9 +813,14 @@ class GenesisStudioX402Orchestrator:
         funded_agents = []
         
         print("💰 Checking wallet balances...")
-        for agent_name, sdk in agents:
-            balance = sdk.wallet_manager.get_wallet_balance(agent_name)
-            address = sdk.wallet_manager.get_wallet_address(agent_name)
+        addresses = [sdk.wallet_manager.get_wallet_address(agent_name) for agent_name, sdk in agents]
+        try:
+            balances = [wei / 10**18 for wei in self._batch_get_balances(addresses)]
+        except Exception as e:
+            print(f"   ⚠️  Batched balance query failed ({e}), querying wallets individually")
+            balances = [sdk.wallet_manager.get_wallet_balance(agent_name) for agent_name, sdk in agents]
+        
+        for (agent_name, sdk), address, balance in zip(agents, addresses, balances):
             print(f"   {agent_name}: {balance:.4f} A0GI ({address})")
             
             if balance > 0.001:  # Has some A0GI for gas
@@ -564,6 +847,8 @@ class GenesisStudioX402Orchestrator:
             try:
                 rprint(f"[blue]🔧 Registering agent: {agent.agent_domain}[/blue]")
                 agent_id = agent.register_identity()
+                if agent_id is not None:
+                    self._agent_ids[agent_name] = agent_id
                 wallet_address = agent.sdk.wallet_address
                 rprint(f"[green]✅ {agent_name} registered successfully[/green]")
                 rprint(f"   Agent ID: {agent_id}")
@@ -586,30 +871,15 @@ class GenesisStudioX402Orchestrator:
     def _create_ap2_intent_mandate(self) -> Dict[str, Any]:
         """Create AP2 intent mandate for micro-loan evaluation service"""
         
-        # Create intent mandate using Alice's AP2 manager - Micro-Loan Scenario
-        intent_mandate = self.alice_sdk.create_intent_mandate(
-            user_description="I need a 0.5 USDC micro-loan for operational expenses. I have 0.78 ERC-8004 reputation score, 8 successful payment history, and can stake 0.25 USDC (50% collateral). No previous defaults. Requesting autonomous loan evaluation and approval.",
-            merchants=None,  # Allow any lender
-            skus=None,  # Allow any loan product
-            requires_refundability=False,  # Loans are not refundable
-            expiry_minutes=60
-        )
-        
-        # Create cart mandate
-        cart_mandate = self.alice_sdk.create_cart_mandate(
-            cart_id="cart_loan_request_001",
-            items=[{"service": "loan_evaluation_agent", "description": "Autonomous micro-loan creditworthiness evaluation with TEE verification", "price": 0.001}],
-            total_amount=0.001,
-            currency="A0GI",
-            merchant_name="Alice Loan Officer Agent",
-            expiry_minutes=15
-        )
-        
-        # Verify JWT token instead of mandate chain for Google AP2
-        mandate_verified = True  # Google AP2 uses JWT verification
-        if hasattr(cart_mandate, 'merchant_authorization') and cart_mandate.merchant_authorization:
-            jwt_payload = self.alice_sdk.google_ap2_integration.verify_jwt_token(cart_mandate.merchant_authorization)
-            mandate_verified = bool(jwt_payload)
+        # The mandate contents are invariant across runs, so reuse the signed and
+        # verified pair until it nears expiry instead of re-signing the JWT
+        cached = self._mandate_cache
+        if cached and time.monotonic() - cached[0] < self.MANDATE_REUSE_SECONDS:
+            _, intent_mandate, cart_mandate, mandate_verified = cached
+            rprint("[cyan]♻️  Reusing signed Google AP2 mandates from this session[/cyan]")
+        else:
+            intent_mandate, cart_mandate, mandate_verified = self._build_ap2_mandates()
+            self._mandate_cache = (time.monotonic(), intent_mandate, cart_mandate, mandate_verified)
         
         # Display created mandates
         rprint(f"[cyan]📝 Created Google AP2 IntentMandate[/cyan]")
@@ -642,6 +912,36 @@ class GenesisStudioX402Orchestrator:
             "verified": mandate_verified
         }
 
+    def _build_ap2_mandates(self) -> tuple:
+        """Create and sign the AP2 intent and cart mandates, verifying the cart JWT"""
+        
+        # Create intent mandate using Alice's AP2 manager - Micro-Loan Scenario
+        intent_mandate = self.alice_sdk.create_intent_mandate(
+            user_description="I need a 0.5 USDC micro-loan for operational expenses. I have 0.78 ERC-8004 reputation score, 8 successful payment history, and can stake 0.25 USDC (50% collateral). No previous defaults. Requesting autonomous loan evaluation and approval.",
+            merchants=None,  # Allow any lender
+            skus=None,  # Allow any loan product
+            requires_refundability=False,  # Loans are not refundable
+            expiry_minutes=60
+        )
+        
+        # Create cart mandate
+        cart_mandate = self.alice_sdk.create_cart_mandate(
+            cart_id="cart_loan_request_001",
+            items=[{"service": "loan_evaluation_agent", "description": "Autonomous micro-loan creditworthiness evaluation with TEE verification", "price": 0.001}],
+            total_amount=0.001,
+            currency="A0GI",
+            merchant_name="Alice Loan Officer Agent",
+            expiry_minutes=15
+        )
+        
+        # Verify JWT token instead of mandate chain for Google AP2
+        mandate_verified = True  # Google AP2 uses JWT verification
+        if hasattr(cart_mandate, 'merchant_authorization') and cart_mandate.merchant_authorization:
+            jwt_payload = self.alice_sdk.google_ap2_integration.verify_jwt_token(cart_mandate.merchant_authorization)
+            mandate_verified = bool(jwt_payload)
+        
+        return intent_mandate, cart_mandate, mandate_verified
+
     def _execute_smart_shopping_with_integrity(self, intent_id: Optional[str] = None) -> tuple[Dict[str, Any], Any, Optional[str], Optional[str]]:
         """Execute smart shopping with Process Integrity verification (EigenAI/0G/CrewAI)
         
@@ -651,7 +951,7 @@ class GenesisStudioX402Orchestrator:
         
         if intent_id:
             rprint(f"[cyan]🔗 Linking to AP2 Intent ID: {intent_id}[/cyan]")
-        rprint(f"[yellow]🏦 Alice evaluating loan request using {os.getenv('COMPUTE_PROVIDER', 'CrewAI').upper()} (TEE-verified)...[/yellow]")
+        rprint(f"[yellow]🏦 Alice evaluating loan request using {self.cfg.compute_provider.upper()} (TEE-verified)...[/yellow]")
         
         # Charlie's loan request (using Charlie's wallet address)
         charlie_address = self.charlie_agent.wallet.address if hasattr(self.charlie_agent, 'wallet') else "0xCharlie"
@@ -723,7 +1023,11 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         
         # Wait for completion
         rprint("[yellow]⏳ Waiting for TEE-verified AI inference...[/yellow]")
-        for i in range(30):
+        # Exponential backoff (0.2s → 2s) so fast jobs are picked up quickly,
+        # bounded by the same ~90s budget as the old 30 x 3s loop
+        deadline = time.monotonic() + 90.0
+        delay = 0.2
+        while True:
             status = self.zg_compute.status(job_id)
             state = status.get("state", "unknown")
             
@@ -734,7 +1038,13 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                 rprint(f"[red]❌ Job failed, using fallback[/red]")
                 return self._execute_smart_shopping_fallback()
             
-            time.sleep(3)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self.verbose:
+                rprint(f"[dim]   Status: {state} (next poll in {delay:.1f}s)[/dim]")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 2.0)
         
         # Get result with attestation
         result = self.zg_compute.result(job_id)
@@ -745,15 +1055,10 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             
             # Display Alice's analysis
             rprint("[bold]🛒 Alice's Shopping Analysis:[/bold]")
-            import json
             try:
                 output_str = result.output.get("output", "{}") if isinstance(result.output, dict) else str(result.output)
-                if "```json" in output_str:
-                    json_start = output_str.find("```json") + 7
-                    json_end = output_str.find("```", json_start)
-                    output_str = output_str[json_start:json_end].strip()
-                
-                analysis = json.loads(output_str)
+                fence = _JSON_FENCE.search(output_str)
+                analysis = _json_loads(fence.group(1) if fence else output_str)
                 rprint(f"   Product: {analysis.get('product_name', 'N/A')}")
                 rprint(f"   Price: ${analysis.get('price', 0)}")
                 rprint(f"   Color: {analysis.get('color', 'N/A')}")
@@ -782,6 +1087,9 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
     
     def _execute_smart_shopping_fallback(self) -> tuple[Dict[str, Any], Any]:
         """Fallback to CrewAI when 0G Compute unavailable"""
+        # Runs in-process on purpose: the crew, its tools and the SDK's integrity
+        # registry are not picklable, and kickoff() is dominated by LLM I/O, so a
+        # process pool would add serialization cost without releasing the GIL
         analysis_result = self.alice_agent.generate_smart_shopping_analysis(
             item_type="winter_jacket",
             color="green", 
@@ -793,7 +1101,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
     def _store_analysis_on_0g_storage(self, analysis_data: Dict[str, Any], process_integrity_proof: Any) -> str:
         """Store analysis data on 0G Storage via gRPC"""
         
-        if not self.zg_storage or not self.zg_storage.is_available:
+        if self.zg_storage is None:
             rprint(f"[yellow]⚠️  0G Storage not available - continuing without storage[/yellow]")
             rprint(f"[yellow]   Analysis data preserved in memory for demo[/yellow]")
             
@@ -805,24 +1113,28 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             }
             return None
         
-        # Create evidence package for 0G Storage
-        evidence = {
-            "type": "genesis_studio_evidence",
-            "agent": "Alice",
-            "role": "server",
-            "service": "smart_shopping_analysis",
-            "timestamp": datetime.now().isoformat(),
-            "analysis": analysis_data,
-            "process_integrity_proof": str(process_integrity_proof) if process_integrity_proof else None,
-            "network": "0G Testnet"
-        }
+        # Key on content (not the upload timestamp) so re-runs reuse the stored object;
+        # the remaining AliceEvidence fields are constants
+        content = {"analysis": analysis_data, "process_integrity_proof": process_integrity_proof or None}
+        idempotency_key = _content_key("alice_analysis", _json_bytes(content))
+        
+        cached = self._storage_cache.get(idempotency_key)
+        if cached is not None:
+            rprint(f"[cyan]♻️  Analysis unchanged since last upload - reusing {cached['uri']}[/cyan]")
+            self.results["storage_analysis"] = cached
+            return cached["root_hash"]
         
         try:
             # Store on 0G Storage using gRPC
+            evidence = AliceEvidence(
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                analysis=analysis_data,
+                process_integrity_proof=process_integrity_proof or None,
+            )
             result = self.zg_storage.put(
-                blob=str(evidence).encode(),
+                blob=_json_bytes(evidence),
                 mime="application/json",
-                idempotency_key=f"alice_analysis_{int(time.time())}"
+                idempotency_key=idempotency_key
             )
             
             if result.success:
@@ -840,6 +1152,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                     "tx_hash": tx_hash,
                     "uri": result.uri
                 }
+                self._storage_cache[idempotency_key] = self.results["storage_analysis"]
                 return root_hash
             else:
                 rprint(f"[yellow]⚠️  0G Storage failed: {result.error}[/yellow]")
@@ -881,11 +1194,12 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         # Display AP2 Intent Authorization (Layer 1 of Triple-Verified Stack)
         rprint(f"[cyan]🔐 AP2 Intent Authorization (Layer 1):[/cyan]")
         total_amount = final_amount
-        if hasattr(cart_mandate, 'contents') and hasattr(cart_mandate.contents, 'payment_request'):
-            total_amount = cart_mandate.contents.payment_request.details.total.amount.value
+        payment_request = _get(_get(cart_mandate, "contents"), "payment_request")
+        if payment_request is not None:
+            total_amount = payment_request.details.total.amount.value
             rprint(f"   Intent Verified: ✅")
             rprint(f"   Authorized Amount: ${total_amount}")
-            rprint(f"   Cart ID: {cart_mandate.cart_id if hasattr(cart_mandate, 'cart_id') else 'N/A'}")
+            rprint(f"   Cart ID: {_get(cart_mandate, 'cart_id', 'N/A')}")
         else:
             rprint(f"   Intent Verified: ✅")
             rprint(f"   User Intent: Smart shopping with green preference")
@@ -899,47 +1213,49 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         # Execute direct A0GI payment on 0G network
         rprint(f"[yellow]📤 Executing direct A0GI transfer...[/yellow]")
         
-        x402_payment_result = self.charlie_sdk.execute_payment(
-            to_agent="Alice",
-            amount=final_amount,
-            service_type="smart_shopping"
-        )
+        x402_payment_result = self._settle_payments([
+            {"to_agent": "Alice", "amount": final_amount, "service_type": "smart_shopping"}
+        ])["Alice"]
         
         # Display payment results
-        rprint(f"[green]💳 Payment Successful (Direct A0GI Transfer)[/green]")
-        rprint(f"   From: Charlie")
-        rprint(f"   To: Alice")
-        if isinstance(x402_payment_result, dict):
-            amount = x402_payment_result.get("amount", 0)
-            tx_hash = x402_payment_result.get("transaction_hash", x402_payment_result.get("tx_hash", "N/A"))
-        else:
-            amount = getattr(x402_payment_result, "amount", 0)
-            tx_hash = getattr(x402_payment_result, "transaction_hash", "N/A")
+        amount = _get(x402_payment_result, "amount", 0)
+        tx_hash = _get(x402_payment_result, "transaction_hash", _get(x402_payment_result, "tx_hash", "N/A"))
         
-        rprint(f"   Amount: {amount:.4f} A0GI" if isinstance(amount, (int, float)) else f"   Amount: {amount}")
-        rprint(f"   Transaction: {tx_hash}")
         if tx_hash and tx_hash != "N/A":
-            if not tx_hash.startswith('0x'):
-                tx_hash = f"0x{tx_hash}"
-        rprint(f"   Explorer: https://chainscan-galileo.0g.ai/tx/{tx_hash}")
-        rprint(f"   Service: Smart Shopping Service")
-        rprint(f"   Network: 0G Galileo Testnet")
+            explorer = _explorer_url(tx_hash)
+        else:
+            explorer = f"{EXPLORER_TX_URL}{tx_hash}"
+        amount_str = f"{amount:.4f} A0GI" if isinstance(amount, (int, float)) else f"{amount}"
+        
+        lines = [
+            "[green]💳 Payment Successful (Direct A0GI Transfer)[/green]",
+            "   From: Charlie",
+            "   To: Alice",
+            f"   Amount: {amount_str}",
+            f"   Transaction: {tx_hash}",
+            f"   Explorer: {explorer}",
+            "   Service: Smart Shopping Service",
+            "   Network: 0G Galileo Testnet",
+        ]
         
         # ✅ (C) Display proof CID linking - accountability layer
         if proof_cid:
-            rprint(f"[bold cyan]🔗 Payment ↔ Proof Linkage (Accountability):[/bold cyan]")
-            rprint(f"   ProcessProof CID: {proof_cid}")
+            lines.append("[bold cyan]🔗 Payment ↔ Proof Linkage (Accountability):[/bold cyan]")
+            lines.append(f"   ProcessProof CID: {proof_cid}")
             if exec_hash:
-                rprint(f"   Execution Hash: 0x{exec_hash[:16]}...")
-            rprint(f"   🎯 Payment verified against TEE execution proof")
-            rprint(f"   📦 Third parties can verify: 0G Storage → Proof CID → Exec Hash")
+                lines.append(f"   Execution Hash: 0x{exec_hash[:16]}...")
+            lines.append("   🎯 Payment verified against TEE execution proof")
+            lines.append("   📦 Third parties can verify: 0G Storage → Proof CID → Exec Hash")
         
         # Triple-Verified Stack Summary
-        rprint()
-        rprint(f"[bold green]🔗 Triple-Verified Stack Complete:[/bold green]")
-        rprint(f"   ✅ Layer 1: AP2 Intent Verification (Google)")
-        rprint(f"   ✅ Layer 2: ChaosChain Process Integrity (ChaosChain + 0G Compute)")
-        rprint(f"   ✅ Layer 3: Adjudication/Accountability (ChaosChain)")
+        lines += [
+            "",
+            "[bold green]🔗 Triple-Verified Stack Complete:[/bold green]",
+            "   ✅ Layer 1: AP2 Intent Verification (Google)",
+            "   ✅ Layer 2: ChaosChain Process Integrity (ChaosChain + 0G Compute)",
+            "   ✅ Layer 3: Adjudication/Accountability (ChaosChain)",
+        ]
+        rprint("\n".join(lines))
         
         payment_results = {
             "x402_payment_result": x402_payment_result,
@@ -960,6 +1276,10 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         self.results["0g_payment"] = payment_results
         return payment_results
     
+    def _settle_payments(self, payments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Settle Charlie's x402 payments (one execute_payment each), keyed by recipient"""
+        return {p["to_agent"]: self.charlie_sdk.execute_payment(**p) for p in payments}
+    
     def _validate_analysis_with_crewai(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Use Bob's CrewAI-powered validator agent for comprehensive analysis validation
@@ -979,22 +1299,26 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         
         return validation_data
     
+    def _analysis_hash(self, analysis_cid: Optional[str], analysis_data: Any) -> str:
+        """0x-prefixed SHA-256 of the analysis CID (or of the data when nothing was stored), memoized"""
+        
+        source = analysis_cid if analysis_cid else str(analysis_data)
+        data_hash = self._data_hash_cache.get(source)
+        if data_hash is None:
+            digest = hashlib.sha256(source.encode()).hexdigest()
+            data_hash = self._data_hash_cache[source] = "0x" + digest
+        return data_hash
+    
     def _request_validation_erc8004(self, analysis_cid: str, analysis_data: Dict[str, Any]) -> str:
         """Request validation from Bob using ERC-8004 ValidationRegistry"""
         
         # Calculate proper hash from CID for blockchain storage (handle None CID)
-        import hashlib
-        if analysis_cid:
-            data_hash = "0x" + hashlib.sha256(analysis_cid.encode()).hexdigest()
-        else:
-            # No storage available - use analysis data hash instead
-            analysis_str = str(analysis_data)
-            data_hash = "0x" + hashlib.sha256(analysis_str.encode()).hexdigest()
+        data_hash = self._analysis_hash(analysis_cid, analysis_data)
         
         try:
             # Check if Bob is registered and has an agent ID
-            bob_agent_id = self.bob_sdk.get_agent_id()
-            alice_agent_id = self.alice_sdk.get_agent_id()
+            bob_agent_id = self._agent_id("Bob")
+            alice_agent_id = self._agent_id("Alice")
             
             if bob_agent_id is None or alice_agent_id is None:
                 rprint(f"[yellow]⚠️  Agents not registered yet. Using fallback validation...[/yellow]")
@@ -1013,7 +1337,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             self.results["erc8004_validation_request"] = {
                 "success": True,
                 "data_hash": data_hash,
-                "validator_agent_id": self.bob_sdk.get_agent_id(),
+                "validator_agent_id": bob_agent_id,
                 "tx_hash": tx_hash
             }
             
@@ -1027,7 +1351,8 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                 "success": False,
                 "simulated": True,
                 "data_hash": data_hash,
-                "validator_agent_id": self.bob_sdk.get_agent_id(),
+                # Cached ID only: a fresh lookup here could hit the same failing RPC
+                "validator_agent_id": self._agent_ids.get("Bob"),
                 "error": str(e)
             }
         
@@ -1042,11 +1367,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             alice_exec_hash: Alice's execution hash for deterministic comparison
             original_inputs: Original inputs Alice used (borrower_address, loan_amount, erc8004_score, etc.)
         """
-        import os
-        import json
-        import hashlib
-        
-        rprint(f"[yellow]🔍 Bob performing validation using {os.getenv('COMPUTE_PROVIDER', 'CrewAI').upper()}...[/yellow]")
+        rprint(f"[yellow]🔍 Bob performing validation using {self.cfg.compute_provider.upper()}...[/yellow]")
         
         # ✅ DETERMINISTIC RE-RUN: Bob executes the SAME analysis with SAME inputs
         if original_inputs and self.compute_provider_name == "eigencompute" and hasattr(self.bob_agent, 'eigencompute'):
@@ -1056,7 +1377,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             rprint(f"[cyan]   ERC-8004 Score: {original_inputs.get('erc8004_score', 0.78)}[/cyan]")
             
             # Bob calls Alice's function in the TEE with the EXACT same inputs
-            app_id = os.getenv("EIGENCOMPUTE_APP_ID")
+            app_id = self.cfg.eigencompute_app_id
             
             result = self.bob_agent.eigencompute.execute(
                 app_id=app_id,
@@ -1153,18 +1474,18 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             rprint(f"\n[cyan]💰 Direct A0GI Payment for validation:[/cyan]")
             rprint(f"[yellow]📤 Executing direct A0GI transfer...[/yellow]")
             
-            validation_payment_result = self.charlie_sdk.execute_payment(
-                to_agent="Bob",
-                amount=0.00005,  # 0.00005 A0GI for validation (small amount for demo)
-                service_type="validation"
-            )
+            validation_payment_result = self._settle_payments([
+                # 0.00005 A0GI for validation (small amount for demo)
+                {"to_agent": "Bob", "amount": 0.00005, "service_type": "validation"}
+            ])["Bob"]
             
-            rprint(f"[green]💳 Payment Successful[/green]")
-            rprint(f"   From: Charlie → Bob")
-            rprint(f"   Amount: {validation_payment_result.amount:.4f} A0GI")
-            rprint(f"   Transaction: {validation_payment_result.transaction_hash}")
-            val_tx_hash = validation_payment_result.transaction_hash if validation_payment_result.transaction_hash.startswith('0x') else f"0x{validation_payment_result.transaction_hash}"
-            rprint(f"   Explorer: https://chainscan-galileo.0g.ai/tx/{val_tx_hash}")
+            rprint(
+                "[green]💳 Payment Successful[/green]\n"
+                "   From: Charlie → Bob\n"
+                f"   Amount: {validation_payment_result.amount:.4f} A0GI\n"
+                f"   Transaction: {validation_payment_result.transaction_hash}\n"
+                f"   Explorer: {_explorer_url(validation_payment_result.transaction_hash)}"
+            )
             
             rprint(f"[green]✅ Validation payment recorded[/green]")
             
@@ -1182,174 +1503,48 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         
         return 75, {"overall_score": 75, "verified": False}
     
-    def _perform_validation_with_payment_fallback(self, analysis_data: Dict[str, Any]) -> tuple[int, Dict[str, Any]]:
-        """Fallback validation when 0G Compute not available - uses CrewAI fallback"""
-        
-        # Use existing CrewAI validation logic
-        if not analysis_data:
-            analysis_data = self.bob_sdk.retrieve_evidence(analysis_cid)
-        else:
-            # No storage available - use in-memory analysis data
-            analysis_data = self.results.get("smart_shopping_analysis", {})
-            rprint(f"[yellow]⚠️  No IPFS storage - using in-memory analysis data for validation[/yellow]")
-        
-        if not analysis_data:
-            # Fallback to mock validation data for demo continuity
-            rprint(f"[yellow]⚠️  No analysis data available - using fallback validation[/yellow]")
-            analysis_data = {
-                "shopping_result": {
-                    "item_type": "winter_jacket",
-                    "final_price": 121.98,
-                    "deal_quality": "excellent",
-                    "merchant": "Premium Outdoor Gear Co.",
-                    "confidence": 0.89
-                }
-            }
-        
-        # Bob performs validation using REAL CrewAI agent logic (production-grade)
-        # Prepare data for validation - ensure proper structure for CrewAI validator
-        if "shopping_result" in analysis_data:
-            # Extract shopping result and flatten for validation
-            shopping_result = analysis_data["shopping_result"]
-            validation_data = {
-                "item_type": shopping_result.get("item_type", "unknown"),
-                "service_type": "smart_shopping",
-                **shopping_result,  # Include all shopping result fields
-                **analysis_data     # Include metadata
-            }
-            validation_result = self._validate_analysis_with_crewai(validation_data)
-        elif "analysis" in analysis_data:
-            validation_result = self._validate_analysis_with_crewai(analysis_data["analysis"])
-        else:
-            # Data is already at the top level
-            validation_result = self._validate_analysis_with_crewai(analysis_data)
-        score = validation_result.get("overall_score", 0)
-        
-        # Execute direct A0GI payment for validation
-        rprint(f"\n[cyan]💰 Direct A0GI Payment for validation:[/cyan]")
-        rprint(f"[yellow]📤 Executing direct A0GI transfer...[/yellow]")
-        
-        validation_payment_result = self.charlie_sdk.execute_payment(
-            to_agent="Bob",
-            amount=0.00005,  # 0.00005 A0GI for validation (small amount for demo)
-            service_type="validation"
-        )
-        
-        rprint(f"[green]💳 Payment Successful[/green]")
-        rprint(f"   From: Charlie → Bob")
-        rprint(f"   Amount: {validation_payment_result.amount:.4f} A0GI")
-        rprint(f"   Transaction: {validation_payment_result.transaction_hash}")
-        val_tx_hash = validation_payment_result.transaction_hash if validation_payment_result.transaction_hash.startswith('0x') else f"0x{validation_payment_result.transaction_hash}"
-        rprint(f"   Explorer: https://chainscan-galileo.0g.ai/tx/{val_tx_hash}")
-        
-        # Store validation report on IPFS with payment proof
-        enhanced_validation_data = {
-            **validation_result,
-            "payment_proof": {
-                "payment_id": validation_payment_result.payment_id,
-                "transaction_hash": validation_payment_result.transaction_hash,
-                "amount": validation_payment_result.amount,
-                "currency": validation_payment_result.currency
-            },
-            "x402_enhanced": True
-        }
-        
-        validation_cid = self.bob_sdk.store_evidence(enhanced_validation_data, "validation")
-        
-        # Display Bob's validation results FIRST (before any potential errors)
-        print(f"🔍 Bob's Validation Results:")
-        print(f"   Overall Score: {score}/100")
-        print(f"   Confidence: {validation_result.get('confidence_score', 0)}/100")
-        print(f"   Completeness: {validation_result.get('completeness_score', 0)}/100") 
-        print(f"   Methodology: {validation_result.get('methodology_score', 0)}/100")
-        print(f"   Summary: {validation_result.get('validation_summary', 'N/A')}")
-        print(f"   Validator: {validation_result.get('validator', 'Bob')}")
-        
-        # Bob submits validation response on-chain (non-blocking)
-        tx_hash = "demo_feedback_skipped"  # Default value
-        try:
-            import hashlib
-            data_hash = "0x" + hashlib.sha256(analysis_cid.encode()).hexdigest()
-            
-            # Submit actual validation response with score via ValidationRegistry
-            tx_hash = self.bob_sdk.submit_validation_response(data_hash, score)
-            print(f"✅ Validation response submitted on-chain: {tx_hash}")
-        except Exception as e:
-            print(f"⚠️  Validation response failed (continuing demo): {e}")
-            # Continue demo even if validation fails
-        
-        rprint(f"[green]🔍 Validation Response Submitted[/green]")
-        rprint(f"   Validator: Bob")
-        rprint(f"   Score: {score}/100")
-        rprint(f"   Transaction: {tx_hash}")
-        
-        # Payment already displayed above
-        
-        self.results["validation"] = {
-            "success": True,
-            "score": score,
-            "validation_cid": validation_cid,
-            "tx_hash": tx_hash,
-            "x402_payment": validation_payment_result
-        }
-        
-        return score, validation_result
-    
     def _create_enhanced_evidence_package(self) -> Dict[str, Any]:
         """Create enhanced evidence package with Triple-Verified Stack proofs"""
         
         # Gather all payment receipts (both AP2 and x402)
         payment_receipts = []
-        
-        # AP2 payment proof
-        if "dual_payment" in self.results and "ap2_payment_proof" in self.results["dual_payment"]:
-            ap2_proof = self.results["dual_payment"]["ap2_payment_proof"]
-            
-            # Get confirmation code safely
-            confirmation_code = "N/A"
-            if hasattr(ap2_proof, 'transaction_details') and ap2_proof.transaction_details:
-                confirmation_code = ap2_proof.transaction_details.get("confirmation_code", "N/A")
-            elif hasattr(ap2_proof, 'proof_id'):
-                confirmation_code = f"AP2_{ap2_proof.proof_id[:8]}"
-            else:
-                confirmation_code = "AP2_PAYMENT_COMPLETED"
-            
-            # Get payment ID safely
-            payment_id = "N/A"
-            if hasattr(ap2_proof, 'proof_id'):
-                payment_id = ap2_proof.proof_id
-            elif hasattr(ap2_proof, 'cart_mandate_id'):
-                payment_id = ap2_proof.cart_mandate_id
+        dual_payment = self.results.get("dual_payment")
+        validation_payment = _validation_x402_payment(self.results)
+        
+        if dual_payment:
+            # AP2 payment proof
+            ap2_proof = dual_payment.get("ap2_payment_proof")
+            if ap2_proof is not None:
+                transaction_details = _get(ap2_proof, "transaction_details")
+                proof_id = _get(ap2_proof, "proof_id")
+                
+                # Get confirmation code safely
+                if transaction_details:
+                    confirmation_code = transaction_details.get("confirmation_code", "N/A")
+                elif proof_id is not None:
+                    confirmation_code = f"AP2_{proof_id[:8]}"
+                else:
+                    confirmation_code = "AP2_PAYMENT_COMPLETED"
+                
+                # Get payment ID safely
+                payment_id = proof_id if proof_id is not None else _get(ap2_proof, "cart_mandate_id", "N/A")
+                
+                payment_receipts.append({
+                    "type": "ap2_universal",
+                    "payment_id": payment_id,
+                    "amount": dual_payment["ap2_amount"],
+                    "confirmation": confirmation_code,
+                    "payment_method": "ap2_universal"
+                })
             
-            payment_receipts.append({
-                "type": "ap2_universal",
-                "payment_id": payment_id,
-                "amount": self.results["dual_payment"]["ap2_amount"],
-                "confirmation": confirmation_code,
-                "payment_method": "ap2_universal"
-            })
-        
-        # x402 crypto payment receipt
-        if "dual_payment" in self.results and "x402_payment_result" in self.results["dual_payment"]:
-            x402_result = self.results["dual_payment"]["x402_payment_result"]
-            payment_receipts.append({
-                "payment_id": x402_result.payment_id,
-                "transaction_hash": x402_result.transaction_hash,
-                "amount": x402_result.amount,
-                "currency": x402_result.currency,
-                "payment_method": str(x402_result.payment_method)
-            })
+            # x402 crypto payment receipt
+            x402_result = dual_payment.get("x402_payment_result")
+            if x402_result is not None:
+                payment_receipts.append(_x402_receipt(x402_result))
         
         # Validation payment receipt
-        if "validation" in self.results and "x402_payment" in self.results["validation"]:
-            validation_payment = self.results["validation"]["x402_payment"]
-            payment_receipts.append({
-                "payment_id": validation_payment.payment_id,
-                "transaction_hash": validation_payment.transaction_hash,
-                "amount": validation_payment.amount,
-                "currency": validation_payment.currency,
-                "payment_method": str(validation_payment.payment_method)
-            })
+        if validation_payment is not None:
+            payment_receipts.append(_x402_receipt(validation_payment))
         
         # Create comprehensive Triple-Verified Stack evidence package
         storage_result = self.results.get("storage_analysis", {})
@@ -1371,25 +1566,25 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         }
         
         # Convert payment receipts to SDK format
-        import time
-        from chaoschain_sdk.types import PaymentProof, PaymentMethod
-        payment_proofs = []
-        for receipt in payment_receipts:
-            if isinstance(receipt, dict):
-                from datetime import datetime
-                payment_proofs.append(PaymentProof(
-                    payment_id=receipt.get("payment_id", "unknown"),
-                    from_agent=receipt.get("from_agent", "Charlie"),
-                    to_agent=receipt.get("to_agent", "Alice"),
-                    amount=receipt.get("amount", 0),
-                    currency=receipt.get("currency", "USDC"),
-                    payment_method=PaymentMethod.A2A_X402,
-                    transaction_hash=receipt.get("transaction_hash", ""),
-                    timestamp=datetime.now(),
-                    receipt_data=receipt
-                ))
-            else:
-                payment_proofs.append(receipt)  # Already a PaymentProof object
+        # One timestamp for the whole package so every receipt agrees
+        now = datetime.now(timezone.utc)
+        a2a_x402 = PaymentMethod.A2A_X402
+        payment_proofs = [
+            PaymentProof(
+                payment_id=receipt.get("payment_id", "unknown"),
+                from_agent=receipt.get("from_agent", "Charlie"),
+                to_agent=receipt.get("to_agent", "Alice"),
+                amount=receipt.get("amount", 0),
+                currency=receipt.get("currency", "USDC"),
+                payment_method=a2a_x402,
+                transaction_hash=receipt.get("transaction_hash", ""),
+                timestamp=now,
+                receipt_data=receipt
+            )
+            if isinstance(receipt, dict)
+            else receipt  # Already a PaymentProof object
+            for receipt in payment_receipts
+        ]
         
         evidence_package_obj = self.alice_sdk.create_evidence_package(
             work_proof=work_data,
@@ -1397,7 +1592,6 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         )
         
         # Convert EvidencePackage to dictionary format for demo compatibility
-        from dataclasses import asdict
         evidence_package = asdict(evidence_package_obj)
         
         # Add Triple-Verified Stack metadata
@@ -1410,12 +1604,17 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             "verification_complete": True
         }
         
+        # Encode the stitched package once; storage reuses these bytes.
+        # Skipped when storage is offline since nothing would consume them.
+        if self.zg_storage is not None:
+            self._ser(evidence_package)
+        
         return evidence_package
     
     def _store_enhanced_evidence_package(self, evidence_package: Dict[str, Any]) -> str:
         """Store enhanced evidence package on 0G Storage"""
         
-        if not self.zg_storage or not self.zg_storage.is_available:
+        if self.zg_storage is None:
             rprint(f"[yellow]⚠️  0G Storage not available - continuing without storage[/yellow]")
             rprint(f"[yellow]   Enhanced evidence package data preserved in memory for demo[/yellow]")
             
@@ -1427,12 +1626,21 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             }
             return None
         
+        blob = self._ser(evidence_package)
+        idempotency_key = _content_key("enhanced_evidence", blob)
+        
+        cached = self._storage_cache.get(idempotency_key)
+        if cached is not None:
+            rprint(f"[cyan]♻️  Evidence package unchanged since last upload - reusing {cached['uri']}[/cyan]")
+            self.results["enhanced_evidence"] = cached
+            return cached["root_hash"]
+        
         try:
             # Store on 0G Storage using gRPC
             result = self.zg_storage.put(
-                blob=str(evidence_package).encode(),
+                blob=blob,
                 mime="application/json",
-                idempotency_key=f"enhanced_evidence_{int(time.time())}"
+                idempotency_key=idempotency_key
             )
             
             if result.success:
@@ -1451,6 +1659,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                     "uri": result.uri,
                     "payment_proofs_included": len(evidence_package.get("payment_proofs", []))
                 }
+                self._storage_cache[idempotency_key] = self.results["enhanced_evidence"]
                 return root_hash
             else:
                 rprint(f"[yellow]⚠️  0G Storage failed: {result.error}[/yellow]")
@@ -1471,210 +1680,219 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             }
             return None
     
+    def _render_report(self):
+        """Render the end-of-run report (final summary + x402 monitoring) in one print"""
+        
+        # Headless runs (GENESIS_QUIET=1) only need self.results, not the rendered report
+        if self.cfg.quiet:
+            return
+        
+        rprint(Group(self._build_final_summary(), self._build_x402_monitoring_summary()))
+    
     def _display_final_summary(self):
         """Display the final success summary with x402 enhancements"""
-        
-        print("DEBUG: _display_final_summary method called")
+        self._render_report()
+    
+    def _display_x402_monitoring_summary(self):
+        """Display x402 payment monitoring and observability metrics"""
+        if not self.cfg.quiet:
+            rprint(self._build_x402_monitoring_summary())
+    
+    def _build_final_summary(self) -> Group:
+        """Final summary table plus the EigenCompute proof block"""
         
         # Extract payment info for use throughout method
-        validation_payment_obj = self.results.get("validation", {}).get("x402_payment")
-        if validation_payment_obj and hasattr(validation_payment_obj, 'amount'):
-            validation_amount = validation_payment_obj.amount
-            validation_tx = validation_payment_obj.transaction_hash or ""
-        else:
-            validation_amount = 0
-            validation_tx = ""
-            
-        # Extract ALL payment info at the beginning for consistent access throughout method
-        dual_payment = self.results.get("dual_payment", {})
-        analysis_payment_obj = dual_payment.get('x402_payment_result')
-        analysis_tx = ""
-        if analysis_payment_obj and hasattr(analysis_payment_obj, 'transaction_hash'):
-            analysis_tx = analysis_payment_obj.transaction_hash or ""
-        
-        # Extract payment amounts for consistent use throughout method
-        print(f"DEBUG: dual_payment = {dual_payment}")
-        analysis_amount = dual_payment.get('x402_amount', 0)
-        ap2_amount = dual_payment.get('ap2_amount', 0)
-        analysis_payment_id = analysis_payment_obj.payment_id[:20] if analysis_payment_obj and hasattr(analysis_payment_obj, 'payment_id') else 'N/A'
-        validation_payment_id = validation_tx[:20] if validation_tx else 'N/A'
-        print(f"DEBUG: analysis_amount = {analysis_amount}, ap2_amount = {ap2_amount}")
-        
-        # Prepare summary data
-        summary_data = {
-            "Agent Registration": {
-                "success": self.results.get("registration", {}).get("success", False),
-                "details": f"Alice, Bob, Charlie registered with on-chain IDs and x402 payment support",
-                "tx_hashes": {name: data.get("tx_hash") for name, data in self.results.get("registration", {}).get("agents", {}).items() if "tx_hash" in data}
-            },
-            "0G Storage": {
-                "success": self.results.get("storage_analysis", {}).get("success", False),
-                "details": "Analysis and evidence packages stored on 0G Storage",
-                "storage": {
-                    "analysis": self.results.get("storage_analysis", {}).get("uri", "N/A"),
-                    "root_hash": self.results.get("storage_analysis", {}).get("root_hash", "N/A")
-                }
-            },
-            "x402 Payments (A0GI)": {
-                "success": self.results.get("0g_payment", {}).get("x402_success", False),
-                "details": f"Agent-to-agent x402 payments in A0GI tokens (0G native currency)",
-                "payments": {
-                    "Analysis Payment": f"{self.results.get('0g_payment', {}).get('amount', 0):.4f} A0GI (Charlie → Alice)",
-                    "Validation Payment": f"{self.results.get('validation', {}).get('x402_payment', type('obj', (), {'amount': 0.001})).amount:.4f} A0GI (Charlie → Bob)" if self.results.get('validation', {}).get('x402_payment') else "0.001 A0GI (Charlie → Bob)",
-                    "Currency": "A0GI (0G native tokens)",
-                    "Protocol": "x402 v0.2.1+",
-                    "Triple-Verified Stack": "✅ Complete"
-                }
-            },
-            "Enhanced Evidence": {
-                "success": self.results.get("enhanced_evidence", {}).get("success", False),
-                "details": "Evidence packages enhanced with x402 payment proofs for PoA verification",
-                "payment_proofs": self.results.get("enhanced_evidence", {}).get("payment_proofs_included", 0)
-            }
-        }
+        validation_payment_obj = _validation_x402_payment(self.results)
         
-        # Display final summary using rich
-        rprint("\n[bold blue]📋 FINAL SUMMARY[/bold blue]")
-        rprint("=" * 60)
+        # Deferred %-formatting: the payment dict is only repr'd when DEBUG is enabled
+        dual_payment = self.results.get("dual_payment", {})
+        logger.debug("building final summary; dual_payment=%s", dual_payment)
+        logger.debug("analysis_amount=%s, ap2_amount=%s", dual_payment.get("x402_amount", 0), dual_payment.get("ap2_amount", 0))
+        
+        # Resolve each results section once for the rows below
+        registration = self.results.get("registration") or {}
+        storage_analysis = self.results.get("storage_analysis") or {}
+        payment_result = self.results.get("0g_payment") or {}
+        enhanced_evidence = self.results.get("enhanced_evidence") or {}
+        
+        # Only successful components get a formatted row; failures collapse into one line
+        rows = []
+        failed = []
+        
+        if registration.get("success", False):
+            rows.append((
+                "Agent Registration",
+                "Alice, Bob, Charlie registered with on-chain IDs and x402 payment support",
+                [f"{name}: {data['tx_hash']}" for name, data in registration.get("agents", {}).items() if data.get("tx_hash")],
+            ))
+        else:
+            failed.append("Agent Registration")
         
-        for component, details in summary_data.items():
-            status = "[green]✅ SUCCESS[/green]" if details["success"] else "[red]❌ FAILED[/red]"
-            rprint(f"\n[bold]{component}[/bold]: {status}")
-            rprint(f"   {details['details']}")
-            
-            if "tx_hashes" in details:
-                for name, tx_hash in details["tx_hashes"].items():
-                    if tx_hash:
-                        rprint(f"   {name}: {tx_hash}")
-            
-            if "cids" in details:
-                for name, cid in details["cids"].items():
-                    if cid:
-                        rprint(f"   {name}: {cid}")
-            
-            if "payments" in details:
-                for payment_name, payment_info in details["payments"].items():
-                    rprint(f"   {payment_name}: {payment_info}")
+        if storage_analysis.get("success", False):
+            rows.append(("0G Storage", "Analysis and evidence packages stored on 0G Storage", []))
+        else:
+            failed.append("0G Storage")
+        
+        if payment_result.get("x402_success", False):
+            validation_amount = f"{validation_payment_obj.amount:.4f}" if validation_payment_obj else "0.001"
+            rows.append((
+                "x402 Payments (A0GI)",
+                "Agent-to-agent x402 payments in A0GI tokens (0G native currency)",
+                [
+                    f"Analysis Payment: {payment_result.get('amount', 0):.4f} A0GI (Charlie → Alice)",
+                    f"Validation Payment: {validation_amount} A0GI (Charlie → Bob)",
+                    "Currency: A0GI (0G native tokens)",
+                    "Protocol: x402 v0.2.1+",
+                    "Triple-Verified Stack: ✅ Complete",
+                ],
+            ))
+        else:
+            failed.append("x402 Payments (A0GI)")
         
+        if enhanced_evidence.get("success", False):
+            rows.append(("Enhanced Evidence", "Evidence packages enhanced with x402 payment proofs for PoA verification", []))
+        else:
+            failed.append("Enhanced Evidence")
+        
+        # Display final summary using rich: one table row per component, printed together
+        # with the buffered detail lines below in a single call
+        renderables = ["\n[bold blue]📋 FINAL SUMMARY[/bold blue]", _SEP60]
+        if rows:
+            table = Table(show_header=True, header_style="bold magenta", border_style="blue")
+            table.add_column("Component", style="bold", overflow="fold")
+            table.add_column("Status", no_wrap=True)
+            table.add_column("Details", overflow="fold")
+            table.add_column("Records", style="yellow", overflow="fold")
+            for component, details, records in rows:
+                table.add_row(component, _OK, details, "\n".join(records))
+            renderables.append(table)
+        if failed:
+            renderables.append(f"[red]❌ FAILED: {', '.join(failed)} - see the phase output above[/red]")
+        
+        lines = []
         # ✅ (D) Display EigenCompute TEE Details
-        payment_result = self.results.get("0g_payment", {})
         if payment_result.get("proof_cid"):
-            rprint(f"\n[bold cyan]🔐 EigenCompute Process Integrity[/bold cyan]: [green]✅ VERIFIED[/green]")
-            rprint(f"   Docker Digest: sha256:00a3561a5aaa83c696b222cad0d1d0564c33614024e04e2b054b4cacce767ae8")
-            rprint(f"   Enclave Wallet: 0x05d39048EDB42183ABaf609f4D5eda3A2a2eDcA3")
-            rprint(f"   ProcessProof CID: {payment_result['proof_cid']}")
+            lines.append(f"\n[bold cyan]🔐 EigenCompute Process Integrity[/bold cyan]: [green]✅ VERIFIED[/green]")
+            lines.append(f"   Docker Digest: sha256:00a3561a5aaa83c696b222cad0d1d0564c33614024e04e2b054b4cacce767ae8")
+            lines.append(f"   Enclave Wallet: 0x05d39048EDB42183ABaf609f4D5eda3A2a2eDcA3")
+            lines.append(f"   ProcessProof CID: {payment_result['proof_cid']}")
             if payment_result.get("exec_hash"):
-                rprint(f"   Execution Hash: 0x{payment_result['exec_hash'][:32]}...")
-            rprint(f"   🎯 Payment linked to verifiable TEE execution")
+                lines.append(f"   Execution Hash: 0x{payment_result['exec_hash'][:32]}...")
+            lines.append(f"   🎯 Payment linked to verifiable TEE execution")
         
-        # Add x402 Payment Monitoring & Observability
-        self._display_x402_monitoring_summary()
+        if lines:
+            renderables.append("\n".join(lines))
+        return Group(*renderables)
     
-    def _display_x402_monitoring_summary(self):
-        """Display x402 payment monitoring and observability metrics"""
+    def _build_x402_monitoring_summary(self) -> Any:
+        """x402 payment monitoring and observability metrics (markup str or Group)"""
         
-        rprint("\n[bold cyan]📊 x402 PAYMENT MONITORING & OBSERVABILITY[/bold cyan]")
-        rprint("=" * 60)
+        lines = ["\n[bold cyan]📊 x402 PAYMENT MONITORING & OBSERVABILITY[/bold cyan]", _SEP60]
         
+        # Only the results walk can fail (missing receipts on partial runs); formatting below
+        # works on the resolved view and aggregates
         try:
-            # Extract actual payment data from demo results
+            view = self._payment_view()
             payment_data = self._extract_x402_payment_data_from_results()
-            
-            rprint(f"\n[bold green]🔍 x402 Protocol Verification[/bold green]")
-            rprint(f"   Protocol: x402 v0.2.1+ (Coinbase Official)")
-            rprint(f"   Network: 0g-testnet")
-            rprint(f"   Treasury: 0x20E7B2A2c8969725b88Dd3EF3a11Bc3353C83F70")
-            rprint(f"   Protocol Fee: 2.5%")
-            rprint(f"   Currency: A0GI (0G native tokens)")
-            rprint(f"   Settlement Mode: Direct A0GI transfers (2 transactions per payment)")
-            
-            rprint(f"\n[bold green]💳 Payment Performance Metrics[/bold green]")
-            if payment_data['total_payments'] > 0:
-                success_rate = (payment_data['successful_payments'] / payment_data['total_payments']) * 100
-                rprint(f"   Success Rate: [green]{success_rate:.1f}%[/green]")
-                rprint(f"   Total Payments: {payment_data['total_payments']}")
-                rprint(f"   Total Volume: [green]{payment_data['total_volume']:.4f} A0GI[/green]")
-                rprint(f"   Protocol Fees Collected: [green]{payment_data['total_fees']:.6f} A0GI[/green]")
-                rprint(f"   Net Amount to Providers: [green]{payment_data['net_to_providers']:.6f} A0GI[/green]")
-            else:
-                rprint(f"   [yellow]No x402 payments in current session[/yellow]")
-            
-            # Multi-Agent x402 Transaction Details
-            rprint(f"\n[bold green]🔗 x402 Transaction Architecture[/bold green]")
-            rprint(f"   Each x402 payment creates [bold]2 separate A0GI transactions[/bold]:")
-            rprint(f"   1️⃣  Protocol Fee → ChaosChain Treasury (2.5% in A0GI)")
-            rprint(f"   2️⃣  Net Payment → Service Provider (97.5% in A0GI)")
-            
-            # Agent-level statistics from demo results
-            rprint(f"\n[bold green]👥 Agent Payment Statistics[/bold green]")
-            
-            # Analysis payment (Charlie → Alice)
-            analysis_payment = self.results.get("analysis", {}).get("dual_payment", {})
-            if analysis_payment.get("x402_payment_result"):
-                payment = analysis_payment["x402_payment_result"]
-                protocol_fee = payment.receipt_data.get("protocol_fee", 0)
-                net_amount = payment.receipt_data.get("net_amount", payment.amount)
-                
-                rprint(f"   🔧 Alice (Server Agent):")
-                rprint(f"     Service: AI Smart Shopping Analysis (0G Compute)")
-                rprint(f"     Received: [green]{net_amount:.6f} A0GI[/green] (net)")
-                rprint(f"     Protocol Fee: [yellow]{protocol_fee:.6f} A0GI[/yellow] → Treasury")
-                rprint(f"     Fee TX: {payment.receipt_data.get('protocol_fee_tx', 'N/A')[:20]}...")
-                rprint(f"     Main TX: {payment.transaction_hash[:20]}...")
-            
-            # Validation payment (Charlie → Bob)
-            validation_payment = self.results.get("validation", {}).get("x402_payment")
-            if validation_payment:
-                protocol_fee = validation_payment.receipt_data.get("protocol_fee", 0)
-                net_amount = validation_payment.receipt_data.get("net_amount", validation_payment.amount)
-                
-                rprint(f"   🔍 Bob (Validator Agent):")
-                rprint(f"     Service: Quality Validation (0G Compute)")
-                rprint(f"     Received: [green]{net_amount:.6f} A0GI[/green] (net)")
-                rprint(f"     Protocol Fee: [yellow]{protocol_fee:.6f} A0GI[/yellow] → Treasury")
-                rprint(f"     Main TX: {validation_payment.transaction_hash[:20]}...")
-            
-            # Charlie's payment summary
-            total_sent = 0
-            total_fees = 0
-            if analysis_payment.get("x402_payment_result"):
-                payment = analysis_payment["x402_payment_result"]
-                total_sent += payment.amount
-                total_fees += payment.receipt_data.get("protocol_fee", 0)
-            if validation_payment:
-                total_sent += validation_payment.amount
-                total_fees += validation_payment.receipt_data.get("protocol_fee", 0)
-                
-            if total_sent > 0:
-                rprint(f"   💳 Charlie (Client Agent):")
-                rprint(f"     Services Purchased: Smart Shopping + Validation")
-                rprint(f"     Total Sent: [red]{total_sent:.4f} A0GI[/red]")
-                rprint(f"     Protocol Fees Paid: [yellow]{total_fees:.6f} A0GI[/yellow]")
-            
-            # Treasury fee collection summary
-            if total_fees > 0:
-                rprint(f"\n[bold green]🏦 ChaosChain Treasury Collection[/bold green]")
-                rprint(f"   Total Fees Collected: [green]{total_fees:.6f} A0GI[/green]")
-                rprint(f"   Fee Percentage: 2.5% of all x402 payments")
-                rprint(f"   Currency: A0GI (0G native tokens)")
-                rprint(f"   Treasury Address: 0x20E7B2A2c8969725b88Dd3EF3a11Bc3353C83F70")
-                rprint(f"   Revenue Model: Automatic fee collection on every x402 payment")
-            
-            rprint(f"\n[bold green]🎯 x402 Benefits Demonstrated[/bold green]")
-            rprint(f"   ✅ Frictionless agent-to-agent payments in A0GI")
-            rprint(f"   ✅ Cryptographic payment receipts for PoA")
-            rprint(f"   ✅ Dual-transaction architecture (fee + payment)")
-            rprint(f"   ✅ Automatic protocol fee collection (2.5% to ChaosChain)")
-            rprint(f"   ✅ Enhanced evidence packages with payment proofs")
-            rprint(f"   ✅ Production-ready A0GI settlement on 0G Testnet")
-            rprint(f"   ✅ Native integration with 0G Compute & Storage")
-            
         except Exception as e:
-            rprint(f"[yellow]⚠️  x402 monitoring unavailable: {e}[/yellow]")
-            rprint(f"   This is expected if no payments were made in this session")
+            lines.append(f"[yellow]⚠️  x402 monitoring unavailable: {e}[/yellow]")
+            lines.append(f"   This is expected if no payments were made in this session")
+            return "\n".join(lines)
+        
+        header = "\n".join(lines)
+        lines = [f"\n[bold green]💳 Payment Performance Metrics[/bold green]"]
+        if payment_data['total_payments'] > 0:
+            success_rate = (payment_data['successful_payments'] / payment_data['total_payments']) * 100
+            lines.append(f"   Success Rate: [green]{success_rate:.1f}%[/green]")
+            lines.append(f"   Total Payments: {payment_data['total_payments']}")
+            lines.append(f"   Total Volume: [green]{payment_data['total_volume']:.4f} A0GI[/green]")
+            lines.append(f"   Protocol Fees Collected: [green]{payment_data['total_fees']:.6f} A0GI[/green]")
+            lines.append(f"   Net Amount to Providers: [green]{payment_data['net_to_providers']:.6f} A0GI[/green]")
+        else:
+            lines.append(f"   [yellow]No x402 payments in current session[/yellow]")
+        
+        # Multi-Agent x402 Transaction Details
+        lines.append(f"\n[bold green]🔗 x402 Transaction Architecture[/bold green]")
+        lines.append(f"   Each x402 payment creates [bold]2 separate A0GI transactions[/bold]:")
+        lines.append(f"   1️⃣  Protocol Fee → ChaosChain Treasury (2.5% in A0GI)")
+        lines.append(f"   2️⃣  Net Payment → Service Provider (97.5% in A0GI)")
+        
+        # Agent-level statistics from demo results
+        lines.append(f"\n[bold green]👥 Agent Payment Statistics[/bold green]")
+        
+        # Analysis payment (Charlie → Alice)
+        analysis = view["analysis"]
+        if analysis:
+            payment = analysis["payment"]
+            lines.append(f"   🔧 Alice (Server Agent):")
+            lines.append(f"     Service: AI Smart Shopping Analysis (0G Compute)")
+            lines.append(f"     Received: [green]{analysis['net']:.6f} A0GI[/green] (net)")
+            lines.append(f"     Protocol Fee: [yellow]{analysis['fee']:.6f} A0GI[/yellow] → Treasury")
+            lines.append(f"     Fee TX: {analysis['short_fee_tx']}...")
+            lines.append(f"     Main TX: {self._short_ids(payment)[0]}...")
+        
+        # Validation payment (Charlie → Bob)
+        validation = view["validation"]
+        if validation:
+            lines.append(f"   🔍 Bob (Validator Agent):")
+            lines.append(f"     Service: Quality Validation (0G Compute)")
+            lines.append(f"     Received: [green]{validation['net']:.6f} A0GI[/green] (net)")
+            lines.append(f"     Protocol Fee: [yellow]{validation['fee']:.6f} A0GI[/yellow] → Treasury")
+            lines.append(f"     Main TX: {self._short_ids(validation['payment'])[0]}...")
+        
+        # Charlie's payment summary (same totals as the performance metrics above)
+        total_sent = payment_data["total_volume"]
+        total_fees = payment_data["total_fees"]
+            
+        if total_sent > 0:
+            lines.append(f"   💳 Charlie (Client Agent):")
+            lines.append(f"     Services Purchased: Smart Shopping + Validation")
+            lines.append(f"     Total Sent: [red]{total_sent:.4f} A0GI[/red]")
+            lines.append(f"     Protocol Fees Paid: [yellow]{total_fees:.6f} A0GI[/yellow]")
+        
+        # Treasury fee collection summary
+        if total_fees > 0:
+            lines.append(f"\n[bold green]🏦 ChaosChain Treasury Collection[/bold green]")
+            lines.append(f"   Total Fees Collected: [green]{total_fees:.6f} A0GI[/green]")
+            lines.append(f"   Fee Percentage: 2.5% of all x402 payments")
+            lines.append(f"   Currency: A0GI (0G native tokens)")
+            lines.append(f"   Treasury Address: 0x20E7B2A2c8969725b88Dd3EF3a11Bc3353C83F70")
+            lines.append(f"   Revenue Model: Automatic fee collection on every x402 payment")
+        
+        return Group(header, _PROTOCOL_VERIFICATION_BLOCK.copy(), "\n".join(lines), _BENEFITS_BLOCK.copy())
+    
+    def _payment_view(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Charlie's recorded x402 payments with their receipt fields, resolved once
+        
+        The summary displays run after the demo has finished writing results, so the
+        lookup is cached on the instance for the remaining display calls.
+        """
+        if self._cached_payment_view is None:
+            analysis_payment = _analysis_x402_payment(self.results)
+            validation_payment = _validation_x402_payment(self.results)
+            view: Dict[str, Optional[Dict[str, Any]]] = {}
+            for key, payment in (("analysis", analysis_payment), ("validation", validation_payment)):
+                if not payment:
+                    view[key] = None
+                    continue
+                receipt = _receipt_data(payment)
+                view[key] = {
+                    "payment": payment,
+                    "receipt": receipt,
+                    "fee": receipt.get("protocol_fee", 0),
+                    "net": receipt.get("net_amount", payment.amount),
+                    "short_fee_tx": receipt.get("protocol_fee_tx", "N/A")[:20],
+                }
+            self._cached_payment_view = view
+        return self._cached_payment_view
     
     def _extract_x402_payment_data_from_results(self):
-        """Extract x402 payment data from demo results for monitoring"""
+        """Extract x402 payment data from demo results for monitoring
+        
+        Aggregated once per run and cached alongside the payment view.
+        """
+        if self._payment_aggregates is not None:
+            return self._payment_aggregates
         
         total_payments = 0
         successful_payments = 0
@@ -1682,201 +1900,31 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         total_fees = 0.0
         net_to_providers = 0.0
         
-        # Analysis payment (Charlie → Alice)
-        analysis_payment = self.results.get("analysis", {}).get("dual_payment", {})
-        if analysis_payment.get("x402_payment_result"):
-            payment = analysis_payment["x402_payment_result"]
-            total_payments += 1
-            successful_payments += 1
-            total_volume += payment.amount
-            protocol_fee = payment.receipt_data.get("protocol_fee", 0)
-            net_amount = payment.receipt_data.get("net_amount", payment.amount)
-            total_fees += protocol_fee
-            net_to_providers += net_amount
-        
-        # Validation payment (Charlie → Bob)
-        validation_payment = self.results.get("validation", {}).get("x402_payment")
-        if validation_payment:
-            total_payments += 1
-            successful_payments += 1
-            total_volume += validation_payment.amount
-            protocol_fee = validation_payment.receipt_data.get("protocol_fee", 0)
-            net_amount = validation_payment.receipt_data.get("net_amount", validation_payment.amount)
-            total_fees += protocol_fee
-            net_to_providers += net_amount
-        
-        return {
+        # Analysis payment (Charlie → Alice), then validation payment (Charlie → Bob)
+        view = self._payment_view()
+        for entry in (view["analysis"], view["validation"]):
+            if entry:
+                total_payments += 1
+                successful_payments += 1
+                total_volume += entry["payment"].amount
+                total_fees += entry["fee"]
+                net_to_providers += entry["net"]
+        
+        self._payment_aggregates = {
             "total_payments": total_payments,
             "successful_payments": successful_payments,
             "total_volume": total_volume,
             "total_fees": total_fees,
             "net_to_providers": net_to_providers
         }
-    
-    def _print_final_success_summary(self):
-        """Print the beautiful final success summary table with x402 enhancements"""
-        
-        from rich.table import Table
-        from rich.align import Align
-        from rich import print as rprint
-        
-        # Create the main success banner
-        success_banner = """
-🎉 **CHAOSCHAIN GENESIS STUDIO TRIPLE-VERIFIED STACK COMPLETE!** 🚀
-
-✅ **FULL END-TO-END TRIPLE-VERIFIED COMMERCIAL PROTOTYPE SUCCESSFUL!**
-
-The complete lifecycle of trustless agentic commerce with Triple-Verified Stack:
-• ERC-8004 Foundation: Identity, Reputation, and Validation registries ✅
-• AP2 Intent Verification: Cryptographic proof of user authorization ✅
-• ChaosChain Process Integrity: Verifiable proof of correct code execution ✅
-• ChaosChain Adjudication: Quality assessment and evidence storage ✅
-• Dual Payment Protocols: AP2 universal + x402 crypto settlement ✅
-• Enhanced Evidence Packages with all verification proofs ✅
-
-🚀 **ChaosChain owns 2 out of 3 verification layers!**
-        """
-        
-        banner_panel = Panel(
-            Align.center(success_banner),
-            title="[bold green]🏆 TRIPLE-VERIFIED STACK DEMO COMPLETE 🏆[/bold green]",
-            border_style="green",
-            padding=(1, 2)
-        )
-        
-        rprint(banner_panel)
-        rprint()
-        
-        # Create the results table
-        table = Table(title="[bold cyan]🚀 ChaosChain Genesis Studio x402 - Final Results Summary[/bold cyan]", 
-                     show_header=True, header_style="bold magenta", border_style="cyan")
-        
-        table.add_column("Component", style="bold white", width=25)
-        table.add_column("Status", style="bold", width=12)
-        table.add_column("Details", style="cyan", width=45)
-        table.add_column("Transaction/Link", style="yellow", width=35)
-        
-        # Agent Registration Results
-        table.add_row(
-            "🤖 Agent Registration",
-            "[green]✅ SUCCESS[/green]",
-            f"Alice (ID: {self.alice_sdk.get_agent_id()}), Bob (ID: {self.bob_sdk.get_agent_id()}), Charlie (ID: {self.charlie_sdk.get_agent_id()}) with x402 support",
-            "ERC-8004 on Base Sepolia"
-        )
-        
-        # x402 Analysis Payment (A0GI)
-        payment_data = self.results.get("0g_payment", {})
-        analysis_amount = payment_data.get('amount', 0)
-        analysis_payment_obj = payment_data.get('x402_payment_result')
-        analysis_tx = ""
-        if analysis_payment_obj and hasattr(analysis_payment_obj, 'transaction_hash'):
-            analysis_tx = analysis_payment_obj.transaction_hash or ""
-        
-        table.add_row(
-            "💳 x402 Analysis Payment",
-            "[green]✅ SUCCESS[/green]" if payment_data.get('x402_success') else "[yellow]⚠️  SIMULATED[/yellow]",
-            f"{analysis_amount:.4f} A0GI: Charlie → Alice",
-            f"0x{analysis_tx[:20]}..." if analysis_tx and analysis_tx != "N/A" else "N/A"
-        )
-        
-        # x402 Validation Payment (A0GI)
-        validation_payment_obj = self.results.get("validation", {}).get("x402_payment")
-        if validation_payment_obj and hasattr(validation_payment_obj, 'amount'):
-            validation_amount = validation_payment_obj.amount
-            validation_tx = validation_payment_obj.transaction_hash or ""
-        else:
-            validation_amount = 0.001  # Default
-            validation_tx = ""
-        
-        # Extract payment IDs for f-string
-        analysis_payment_id = analysis_payment_obj.payment_id[:20] if analysis_payment_obj and hasattr(analysis_payment_obj, 'payment_id') else 'N/A'
-        validation_payment_id = validation_tx[:20] if validation_tx else 'N/A'
-        
-        table.add_row(
-            "💳 x402 Validation Payment",
-            "[green]✅ SUCCESS[/green]" if validation_tx else "[yellow]⚠️  SIMULATED[/yellow]",
-            f"{validation_amount:.4f} A0GI: Charlie → Bob",
-            f"0x{validation_tx[:20]}..." if validation_tx and validation_tx != "N/A" else "N/A"
-        )
-        
-        # Enhanced Evidence Package
-        enhanced_evidence = self.results.get("enhanced_evidence", {})
-        table.add_row(
-            "📦 Enhanced Evidence",
-            "[green]✅ SUCCESS[/green]",
-            f"Evidence package with {enhanced_evidence.get('payment_proofs_included', 0)} payment proofs",
-            f"IPFS: {enhanced_evidence.get('cid', 'N/A')[:20]}..."
-        )
-        
-        # Validation Results
-        validation_score = self.results.get("validation", {}).get("score", 0)
-        table.add_row(
-            "🔍 PoA Validation",
-            "[green]✅ SUCCESS[/green]",
-            f"Score: {validation_score}/100 with payment verification",
-            f"Enhanced with x402 receipts"
-        )
-        
-        rprint(table)
-        rprint()
-        
-        # Payment amounts already extracted at the beginning of method
-        
-        # Create payment summary content as a string first
-        payment_summary_content = f"""[bold cyan]💳 x402 Payment Protocol Summary (A0GI):[/bold cyan]
-
-[yellow]Smart Shopping Service Payment:[/yellow]
-• Amount: {analysis_amount:.4f} A0GI (x402 settlement)
-• From: Charlie → Alice
-• Service: AI Smart Shopping (0G Compute)
-• Currency: A0GI (0G native tokens)
-• Network: 0G Testnet
-• Payment ID: {analysis_payment_id}...
-
-[yellow]Validation Service Payment:[/yellow]
-• Amount: {validation_amount:.4f} A0GI  
-• From: Charlie → Bob
-• Service: Quality Validation (0G Compute)
-• Currency: A0GI (0G native tokens)
-• Network: 0G Testnet
-• Payment ID: {validation_payment_id}...
-
-[bold green]🎯 x402 Protocol Benefits:[/bold green]
-• Frictionless agent-to-agent payments in A0GI ✅
-• Cryptographic payment receipts for PoA ✅
-• No complex wallet setup required ✅
-• Instant settlement on 0G Testnet ✅
-• Enhanced evidence packages with payment proofs ✅
-• Native integration with 0G Network ✅
-
-[bold magenta]💰 Economic Impact:[/bold magenta]
-• Alice earned {analysis_amount:.4f} A0GI for loan evaluation service
-• Bob earned {validation_amount:.4f} A0GI for audit service
-• Charlie received autonomous loan decision with TEE-verified creditworthiness evaluation
-• Complete audit trail for trustless autonomous lending established
-• All transactions in 0G native tokens (A0GI)
-
-[bold red]🔧 Next Steps:[/bold red]
-• Enhanced evidence packages with payment proofs
-• Multi-agent autonomous lending workflows
-• Cross-chain x402 payment support with 0G Bridge"""
-
-        # Create and display the panel
-        payment_summary_panel = Panel(
-            payment_summary_content,
-            title="[bold green]🌟 x402 Commercial Success Metrics[/bold green]",
-            border_style="green"
-        )
-        
-        rprint(payment_summary_panel)
+        return self._payment_aggregates
 
 
 def main():
     """Main entry point for 0G-integrated Genesis Studio"""
     
     # Check if we're on the correct network
-    network = os.getenv("NETWORK", "local")
-    if network != "0g-testnet":
+    if RUNTIME_CONFIG.network != "0g-testnet":
         print("⚠️  Warning: This demo is designed for 0G Testnet.")
         print("   Please set NETWORK=0g-testnet in your .env file.")
         print()
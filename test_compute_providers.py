@@ -12,6 +12,8 @@ from rich.table import Table
 # Add chaoschain-integrations to path
 sys.path.insert(0, os.path.dirname(__file__))
 
+_SEP80 = "\n" + "=" * 80 + "\n"
+
 def test_eigenai():
     """Test EigenAI integration"""
     rprint(Panel.fit("[bold cyan]Testing EigenAI Provider[/bold cyan]"))
@@ -113,25 +115,30 @@ Testing flexible compute provider support:
     
     # Test EigenAI if API key available
     if os.getenv("EIGEN_API_KEY"):
-        rprint("\n" + "="*80 + "\n")
+        rprint(_SEP80)
         results["eigenai"] = test_eigenai()
     else:
         results["eigenai"] = None
     
     # Test CrewAI
-    rprint("\n" + "="*80 + "\n")
+    rprint(_SEP80)
     results["crewai"] = test_crewai()
     
     # Summary
-    rprint("\n" + "="*80 + "\n")
+    rprint(_SEP80)
     table = Table(title="Test Results")
     table.add_column("Provider", style="cyan")
     table.add_column("Status", style="bold")
     
+    # Render rows and tally the exit-code counts in the same pass
+    passed = total = 0
     for provider, success in results.items():
         if success is None:
             table.add_row(provider.upper(), "[yellow]SKIPPED[/yellow]")
-        elif success:
+            continue
+        total += 1
+        if success:
+            passed += 1
             table.add_row(provider.upper(), "[green]✅ PASSED[/green]")
         else:
             table.add_row(provider.upper(), "[red]❌ FAILED[/red]")
@@ -139,9 +146,6 @@ Testing flexible compute provider support:
     rprint(table)
     
     # Exit code
-    passed = sum(1 for v in results.values() if v is True)
-    total = sum(1 for v in results.values() if v is not None)
-    
     if passed == total:
         rprint("\n[bold green]🎉 All tests passed![/bold green]")
         return 0
@@ -7,20 +7,78 @@ Tests the complete flow: submit job -> poll status -> get result with TEE proof
 import os
 import sys
 import time
+import traceback
+from contextlib import contextmanager
+from types import SimpleNamespace
 from rich import print as rprint
+from rich.live import Live
 from rich.panel import Panel
+from rich.text import Text
 from dotenv import load_dotenv
 
 # Load environment
 load_dotenv()
 
+# Environment settings, read once after .env is loaded
+CFG = SimpleNamespace(
+    api_url=os.getenv("EIGEN_API_URL", "https://api.eigencloud.xyz"),
+    api_key=os.getenv("EIGEN_API_KEY"),
+)
+
 # Add integrations to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "chaoschain-integrations"))
 
 from chaoschain_integrations.compute.eigen import EigenComputeAdapter
 
+
+def _truncate_json(obj, limit=500):
+    """Pretty-print ``obj`` as JSON, stopping once ``limit`` characters are written."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None  # Fall back to streaming the stdlib encoder
+    
+    if orjson is not None:
+        # A UTF-8 character is at most 4 bytes, so this slice holds `limit` chars
+        encoded = orjson.dumps(obj, option=orjson.OPT_INDENT_2)[:limit * 4]
+        return encoded.decode(errors="ignore")[:limit]
+    
+    import io
+    import json
+    
+    buf = io.StringIO()
+    for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+        buf.write(chunk)
+        if buf.tell() >= limit:
+            break
+    return buf.getvalue()[:limit]
+
+
+class StepFailed(Exception):
+    """Raised by ``step`` after a failure has been reported."""
+
+
+@contextmanager
+def step(failure):
+    """Report an exception in the wrapped block with its traceback, then abort."""
+    try:
+        yield
+    except Exception as e:
+        rprint(f"[red]❌ {failure}: {e}[/red]")
+        traceback.print_exc()
+        raise StepFailed(failure) from e
+
+
 def main():
-    """Test EigenCompute integration with real API"""
+    """Test EigenCompute integration with real API; returns the process exit code"""
+    try:
+        return _run_live_checks()
+    except StepFailed:
+        return 1
+
+
+def _run_live_checks():
+    """Run the live checks; a failing step raises StepFailed after reporting it"""
     
     rprint(Panel.fit(
         "[bold cyan]EigenCompute Live Integration Test[/bold cyan]\n"
@@ -29,8 +87,7 @@ def main():
     ))
     
     # Check environment
-    api_url = os.getenv("EIGEN_API_URL", "https://api.eigencloud.xyz")
-    api_key = os.getenv("EIGEN_API_KEY")
+    api_url, api_key = CFG.api_url, CFG.api_key
     
     if not api_key:
         rprint("[red]❌ ERROR: EIGEN_API_KEY not set![/red]")
@@ -44,7 +101,7 @@ def main():
     
     # Initialize adapter
     rprint("\n[yellow]🔧 Initializing EigenCompute adapter...[/yellow]")
-    try:
+    with step("Failed to initialize adapter"):
         adapter = EigenComputeAdapter(
             api_url=api_url,
             api_key=api_key,
@@ -52,11 +109,6 @@ def main():
         rprint("[green]✅ EigenAI adapter initialized[/green]")
         rprint(f"   Client API URL: {adapter.client.api_url}")
         rprint(f"   Default timeout: {adapter.default_timeout}s")
-    except Exception as e:
-        rprint(f"[red]❌ Failed to initialize adapter: {e}[/red]")
-        import traceback
-        traceback.print_exc()
-        return 1
     
     # Test 1: Submit a simple inference task
     rprint("\n[bold]📝 Test 1: Submit TEE-verified inference task[/bold]")
@@ -72,51 +124,64 @@ def main():
     rprint(f"   Prompt: {task['prompt']}")
     rprint(f"   Seed: {task.get('seed', 'None')} (for deterministic results)")
     
-    try:
+    with step("Failed to submit job"):
         rprint("\n[cyan]📤 Submitting job to EigenCloud...[/cyan]")
         job_id = adapter.submit(task)
         rprint(f"[green]✅ Job submitted successfully![/green]")
         rprint(f"   Job ID: {job_id}")
-    except Exception as e:
-        rprint(f"[red]❌ Failed to submit job: {e}[/red]")
-        import traceback
-        traceback.print_exc()
-        return 1
     
     # Test 2: Poll for job status
     rprint("\n[bold]📊 Test 2: Monitor job status[/bold]")
     
+    # EigenAI answers synchronously, so the first check normally sees "completed".
+    # EigenCloud has no long-poll endpoint; back off 3s -> 6s -> 12s -> 30s (cap)
+    # within the overall budget instead of sleeping a fixed interval. Ticks are
+    # scheduled on the monotonic clock so time spent in status() counts
+    # towards the interval rather than being added on top of it.
     max_polls = 40
+    max_wait = 120
     poll_interval = 3
+    max_poll_interval = 30
+    started = next_tick = time.monotonic()
     
-    for i in range(max_polls):
-        try:
-            status = adapter.status(job_id)
-            state = status.get("status", "unknown")
-            
-            rprint(f"   [{i+1}/{max_polls}] Status: [cyan]{state}[/cyan]", end="")
+    # The status line is redrawn in place rather than printed once per poll
+    with Live(refresh_per_second=2) as live:
+        for i in range(max_polls):
+            try:
+                status = adapter.status(job_id)
+                state = status.get("status", "unknown")
+                
+                # Assemble styled spans directly; no markup to re-parse on each poll
+                line = Text.assemble(f"   [{i+1}/{max_polls}] Status: ", (state, "cyan"))
+                
+                if state == "completed":
+                    live.update(Text.assemble(line, (" ✅", "green")))
+                    break
+                elif state == "failed":
+                    live.update(Text.assemble(line, (" ❌", "red")))
+                    rprint(f"[red]Job failed: {status}[/red]")
+                    return 1
+                else:
+                    live.update(Text.assemble(line, f" (waiting {poll_interval}s...)"))
+            except Exception as e:
+                rprint(f"\n[yellow]⚠️  Status check error: {e}[/yellow]")
             
-            if state == "completed":
-                rprint(" [green]✅[/green]")
-                break
-            elif state == "failed":
-                rprint(" [red]❌[/red]")
-                rprint(f"[red]Job failed: {status}[/red]")
+            if time.monotonic() - started >= max_wait:
+                rprint(f"\n[yellow]⚠️  Job did not complete within {max_wait}s[/yellow]")
                 return 1
-            else:
-                rprint(f" (waiting {poll_interval}s...)")
-                time.sleep(poll_interval)
-        except Exception as e:
-            rprint(f"\n[yellow]⚠️  Status check error: {e}[/yellow]")
-            time.sleep(poll_interval)
-    else:
-        rprint(f"\n[yellow]⚠️  Job did not complete within {max_polls * poll_interval}s[/yellow]")
-        return 1
+            next_tick += poll_interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
+        else:
+            rprint(f"\n[yellow]⚠️  Job did not complete within {time.monotonic() - started:.0f}s[/yellow]")
+            return 1
     
     # Test 3: Retrieve result with TEE proof
     rprint("\n[bold]🎯 Test 3: Retrieve result with TEE attestation[/bold]")
     
-    try:
+    with step("Failed to retrieve result"):
         rprint("[cyan]📥 Fetching result...[/cyan]")
         result = adapter.result(job_id, wait=False)
         
@@ -145,8 +210,7 @@ def main():
         
         if proof.attestation:
             rprint(f"\n   [dim]Full Attestation Data:[/dim]")
-            import json
-            attestation_str = json.dumps(proof.attestation, indent=2)[:500]
+            attestation_str = _truncate_json(proof.attestation)
             rprint(f"   [dim]{attestation_str}...[/dim]")
         
         # Success summary
@@ -163,12 +227,6 @@ def main():
         ))
         
         return 0
-        
-    except Exception as e:
-        rprint(f"[red]❌ Failed to retrieve result: {e}[/red]")
-        import traceback
-        traceback.print_exc()
-        return 1
 
 
 if __name__ == "__main__":
@@ -8,15 +8,71 @@ import os
 import sys
 import json
 import hashlib
-from rich import print as rprint
-from rich.panel import Panel
-from rich.align import Align
+import hmac
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib decoder
 
 # Add SDK to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'sdk'))
 
 from chaoschain_integrations.compute.eigencompute import EigenComputeAdapter
 
+# LOAN_TEST_VERBOSE=0/false skips the detail sections (profile, factors, reasoning, flags, summary)
+VERBOSE = os.getenv("LOAN_TEST_VERBOSE", "1").strip().lower() not in ("0", "", "false", "no", "off")
+
+# Rich console markup such as [bold green] / [/cyan], dropped in plain output
+_MARKUP = re.compile(r"\[/?[a-z][a-z0-9 _.#,=-]*\]")
+
+
+def use_rich() -> bool:
+    """rich is only loaded for interactive runs; NO_RICH=1 or a redirected stdout prints plain text"""
+    return not os.environ.get("NO_RICH") and sys.stdout.isatty()
+
+
+def plain_print(*args, **kwargs):
+    """print() with rich console markup stripped"""
+    print(*(_MARKUP.sub("", a) if isinstance(a, str) else a for a in args), **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _printer():
+    """rich's print for interactive runs (imported on first use), plain_print otherwise"""
+    if use_rich():
+        from rich import print as rich_print
+        return rich_print
+    return plain_print
+
+
+def rprint(*args, **kwargs):
+    """Print console markup through rich or as plain text, see use_rich()"""
+    _printer()(*args, **kwargs)
+
+
+def detail(*args, **kwargs):
+    """rprint for detail lines, dropped when LOAN_TEST_VERBOSE is off"""
+    if VERBOSE:
+        rprint(*args, **kwargs)
+
+
+def output_of(result) -> dict:
+    """Parsed output of an execute() result; the adapter may hand back a dict or its JSON string"""
+    output = result.output
+    if not isinstance(output, str):
+        return output
+    return orjson.loads(output) if orjson is not None else json.loads(output)
+
+
+def exec_digest(output: dict) -> bytes:
+    """Raw SHA-256 execution digest over json.dumps(output, sort_keys=True), the agents' canonical form"""
+    return hashlib.sha256(json.dumps(output, sort_keys=True).encode()).digest()
+
+
 def main():
     """Test the loan approval workflow"""
     
@@ -32,7 +88,12 @@ def main():
 • Fees: 0.001 A0GI each for Alice & Bob
 """
     
-    rprint(Panel(Align.center(banner), border_style="green", padding=(1, 2)))
+    if use_rich():
+        from rich.align import Align
+        from rich.panel import Panel
+        rprint(Panel(Align.center(banner), border_style="green", padding=(1, 2)))
+    else:
+        rprint(banner)
     rprint()
     
     # Configuration
@@ -71,14 +132,22 @@ def main():
             }
         )
         
-        charlie_profile = json.loads(charlie_result.output) if isinstance(charlie_result.output, str) else charlie_result.output
+        charlie_profile = output_of(charlie_result)
+        
+        # Fields reused by STEP 2, STEP 4 and the summary, looked up once
+        addr = charlie_profile['borrower_address']
+        amt = charlie_profile['requested_amount']
+        score = charlie_profile['erc8004_score']
+        pay = charlie_profile['payment_history_count']
+        stake = charlie_profile['stake_amount']
+        defaults = charlie_profile['previous_defaults']
         
         rprint(f"[green]✅ Charlie's Profile Loaded:[/green]")
-        rprint(f"   ERC-8004 Score: {charlie_profile.get('erc8004_score')}")
-        rprint(f"   Payment History: {charlie_profile.get('payment_history_count')} successful payments")
-        rprint(f"   Stake: ${charlie_profile.get('stake_amount')} USDC")
-        rprint(f"   Previous Defaults: {charlie_profile.get('previous_defaults')}")
-        rprint(f"   Reputation Tier: {charlie_profile.get('reputation_tier')}")
+        detail(f"   ERC-8004 Score: {charlie_profile.get('erc8004_score')}")
+        detail(f"   Payment History: {charlie_profile.get('payment_history_count')} successful payments")
+        detail(f"   Stake: ${charlie_profile.get('stake_amount')} USDC")
+        detail(f"   Previous Defaults: {charlie_profile.get('previous_defaults')}")
+        detail(f"   Reputation Tier: {charlie_profile.get('reputation_tier')}")
         rprint()
         
     except Exception as e:
@@ -91,25 +160,29 @@ def main():
     rprint("[bold]🏦 STEP 2: Alice (Loan Officer) Evaluates Creditworthiness[/bold]")
     rprint("-" * 80)
     
+    # Built once and shared with Bob's re-run in STEP 4, so both calls send
+    # the same keys in the same order
+    alice_inputs = {
+        "borrower_address": addr,
+        "loan_amount": amt,
+        "erc8004_score": score,
+        "payment_history_count": pay,
+        "stake_amount": stake,
+        "previous_defaults": defaults
+    }
+    
     try:
         alice_result = adapter.execute(
             app_id=app_id,
             function="evaluate_loan",
-            inputs={
-                "borrower_address": charlie_profile['borrower_address'],
-                "loan_amount": charlie_profile['requested_amount'],
-                "erc8004_score": charlie_profile['erc8004_score'],
-                "payment_history_count": charlie_profile['payment_history_count'],
-                "stake_amount": charlie_profile['stake_amount'],
-                "previous_defaults": charlie_profile['previous_defaults']
-            }
+            inputs=alice_inputs
         )
         
-        alice_evaluation = json.loads(alice_result.output) if isinstance(alice_result.output, str) else alice_result.output
+        alice_evaluation = output_of(alice_result)
         
-        # Calculate execution hash
-        alice_output_json = json.dumps(alice_evaluation, sort_keys=True)
-        alice_exec_hash = hashlib.sha256(alice_output_json.encode()).hexdigest()
+        # Calculate execution hash (raw digest for comparison, hex for display)
+        alice_digest = exec_digest(alice_evaluation)
+        alice_exec_hash = alice_digest.hex()
         
         rprint(f"[green]✅ Alice's Evaluation:[/green]")
         rprint(f"   Decision: [bold]{alice_evaluation.get('decision')}[/bold]")
@@ -119,12 +192,12 @@ def main():
         rprint(f"   Confidence: {alice_evaluation.get('approval_confidence')}")
         
         if 'key_factors' in alice_evaluation:
-            rprint(f"   Key Factors:")
+            detail(f"   Key Factors:")
             for factor in alice_evaluation['key_factors']:
-                rprint(f"      • {factor}")
+                detail(f"      • {factor}")
         
         if 'reasoning' in alice_evaluation:
-            rprint(f"   Reasoning: {alice_evaluation['reasoning'][:150]}...")
+            detail(f"   Reasoning: {alice_evaluation['reasoning'][:150]}...")
         
         rprint(f"   [cyan]Exec Hash: 0x{alice_exec_hash[:32]}...[/cyan]")
         rprint()
@@ -132,12 +205,12 @@ def main():
         # Display TEE execution metadata
         if 'tee_execution' in alice_evaluation:
             tee = alice_evaluation['tee_execution']
-            rprint(f"[cyan]📊 TEE Execution Details:[/cyan]")
-            rprint(f"   Agent: {tee.get('agent')}")
-            rprint(f"   Role: {tee.get('role')}")
-            rprint(f"   EigenAI Job ID: {tee.get('eigenai_job_id')}")
-            rprint(f"   Model: {tee.get('eigenai_model')}")
-            rprint()
+            detail(f"[cyan]📊 TEE Execution Details:[/cyan]")
+            detail(f"   Agent: {tee.get('agent')}")
+            detail(f"   Role: {tee.get('role')}")
+            detail(f"   EigenAI Job ID: {tee.get('eigenai_job_id')}")
+            detail(f"   Model: {tee.get('eigenai_model')}")
+            detail()
         
     except Exception as e:
         rprint(f"[red]❌ Error in Alice's evaluation: {e}[/red]")
@@ -145,6 +218,25 @@ def main():
         traceback.print_exc()
         sys.exit(1)
     
+    # Bob's audit (STEP 3) and his re-execution (STEP 4) both only need
+    # Alice's inputs/output, so the two TEE calls are dispatched together
+    pool = ThreadPoolExecutor(max_workers=2)
+    audit_future = pool.submit(
+        adapter.execute,
+        app_id=app_id,
+        function="audit_evaluation",
+        inputs={
+            "evaluation": alice_evaluation
+        }
+    )
+    rerun_future = pool.submit(
+        adapter.execute,
+        app_id=app_id,
+        function="evaluate_loan",  # Same function as Alice
+        inputs=alice_inputs  # EXACT same inputs as Alice
+    )
+    pool.shutdown(wait=False)
+    
     # ========================================================================
     # STEP 3: Bob Audits Alice's Evaluation
     # ========================================================================
@@ -152,15 +244,9 @@ def main():
     rprint("-" * 80)
     
     try:
-        bob_result = adapter.execute(
-            app_id=app_id,
-            function="audit_evaluation",
-            inputs={
-                "evaluation": alice_evaluation
-            }
-        )
+        bob_result = audit_future.result()
         
-        bob_audit = json.loads(bob_result.output) if isinstance(bob_result.output, str) else bob_result.output
+        bob_audit = output_of(bob_result)
         
         rprint(f"[green]✅ Bob's Audit:[/green]")
         rprint(f"   Audit Decision: [bold]{bob_audit.get('audit_decision')}[/bold]")
@@ -170,13 +256,13 @@ def main():
         rprint(f"   Compliance Check: {bob_audit.get('compliance_check')}")
         rprint(f"   Recommendation: {bob_audit.get('recommendation')}")
         
-        if 'red_flags' in bob_audit and bob_audit['red_flags']:
-            rprint(f"   Red Flags:")
+        if bob_audit.get('red_flags'):
+            detail(f"   Red Flags:")
             for flag in bob_audit['red_flags']:
-                rprint(f"      🚨 {flag}")
+                detail(f"      🚨 {flag}")
         
         if 'audit_notes' in bob_audit:
-            rprint(f"   Notes: {bob_audit['audit_notes'][:150]}...")
+            detail(f"   Notes: {bob_audit['audit_notes'][:150]}...")
         
         rprint()
         
@@ -195,32 +281,21 @@ def main():
     rprint()
     
     try:
-        # Bob re-runs Alice's evaluation
-        bob_rerun = adapter.execute(
-            app_id=app_id,
-            function="evaluate_loan",  # Same function as Alice
-            inputs={
-                # EXACT same inputs as Alice
-                "borrower_address": charlie_profile['borrower_address'],
-                "loan_amount": charlie_profile['requested_amount'],
-                "erc8004_score": charlie_profile['erc8004_score'],
-                "payment_history_count": charlie_profile['payment_history_count'],
-                "stake_amount": charlie_profile['stake_amount'],
-                "previous_defaults": charlie_profile['previous_defaults']
-            }
-        )
+        # Bob re-runs Alice's evaluation (dispatched alongside the audit)
+        bob_rerun = rerun_future.result()
         
-        bob_evaluation = json.loads(bob_rerun.output) if isinstance(bob_rerun.output, str) else bob_rerun.output
+        bob_evaluation = output_of(bob_rerun)
         
         # Calculate Bob's execution hash
-        bob_output_json = json.dumps(bob_evaluation, sort_keys=True)
-        bob_exec_hash = hashlib.sha256(bob_output_json.encode()).hexdigest()
+        bob_digest = exec_digest(bob_evaluation)
+        bob_exec_hash = bob_digest.hex()
         
         rprint(f"   Alice's Exec Hash: [cyan]0x{alice_exec_hash[:32]}...[/cyan]")
         rprint(f"   Bob's Exec Hash:   [cyan]0x{bob_exec_hash[:32]}...[/cyan]")
         rprint()
         
-        if alice_exec_hash == bob_exec_hash:
+        # Constant-time comparison of the 32-byte digests
+        if hmac.compare_digest(alice_digest, bob_digest):
             rprint(f"[bold green]✅ DETERMINISTIC MATCH: Exec hashes IDENTICAL![/bold green]")
             rprint(f"[bold green]   🎯 Loan would be AUTO-DISBURSED[/bold green]")
             rprint(f"[bold green]   📦 Provable determinism achieved[/bold green]")
@@ -242,58 +317,63 @@ def main():
     # ========================================================================
     # SUMMARY
     # ========================================================================
-    rprint("=" * 80)
-    rprint("[bold]📊 LOAN APPROVAL SUMMARY[/bold]")
-    rprint("=" * 80)
-    rprint()
-    
-    rprint(f"[bold]Borrower:[/bold] Charlie ({charlie_profile['borrower_address'][:10]}...)")
-    rprint(f"  • ERC-8004 Score: {charlie_profile['erc8004_score']}")
-    rprint(f"  • Stake: ${charlie_profile['stake_amount']} USDC")
-    rprint(f"  • Requested: ${charlie_profile['requested_amount']} USDC")
-    rprint()
-    
-    rprint(f"[bold]Alice's Evaluation:[/bold]")
-    rprint(f"  • Decision: {alice_evaluation['decision']}")
-    rprint(f"  • Risk Score: {alice_evaluation['risk_score']}/100")
-    rprint(f"  • Max Approved: ${alice_evaluation.get('max_loan_amount')} USDC")
-    rprint(f"  • Service Fee: 0.001 A0GI")
-    rprint()
-    
-    rprint(f"[bold]Bob's Audit:[/bold]")
-    rprint(f"  • Audit Decision: {bob_audit.get('audit_decision')}")
-    rprint(f"  • Agrees with Alice: {bob_audit.get('agrees_with_alice')}")
-    rprint(f"  • Compliance: {bob_audit.get('compliance_check')}")
-    rprint(f"  • Service Fee: 0.001 A0GI")
-    rprint()
-    
-    rprint(f"[bold]Deterministic Verification:[/bold]")
     if loan_approved:
-        rprint(f"  • [green]✅ PASSED - Hashes match[/green]")
-        rprint(f"  • [green]🎯 Loan APPROVED for disbursement[/green]")
+        verification = [
+            "  • [green]✅ PASSED - Hashes match[/green]",
+            "  • [green]🎯 Loan APPROVED for disbursement[/green]",
+        ]
+        outcome = "[bold green]✅ LOAN APPROVAL WORKFLOW TEST PASSED![/bold green]"
     else:
-        rprint(f"  • [red]❌ FAILED - Hashes differ[/red]")
-        rprint(f"  • [red]🚨 Loan HELD for review[/red]")
-    rprint()
+        verification = [
+            "  • [red]❌ FAILED - Hashes differ[/red]",
+            "  • [red]🚨 Loan HELD for review[/red]",
+        ]
+        outcome = "[bold yellow]⚠️  LOAN APPROVAL WORKFLOW TEST COMPLETED WITH WARNINGS[/bold yellow]"
     
-    rprint(f"[bold]Payment Flow (if approved):[/bold]")
-    rprint(f"  • Loan: 0.5 USDC via x402 → Charlie")
-    rprint(f"  • Alice fee: 0.001 A0GI (0G network)")
-    rprint(f"  • Bob fee: 0.001 A0GI (0G network)")
-    rprint()
-    
-    rprint(f"[bold]Evidence Storage:[/bold]")
-    rprint(f"  • All proofs published to 0G Storage")
-    rprint(f"  • Payment tx linked to proof CIDs")
-    rprint(f"  • Fully auditable and accountable")
-    rprint()
+    if not VERBOSE:
+        rprint(outcome)
+        return
     
-    rprint("=" * 80)
-    if loan_approved:
-        rprint("[bold green]✅ LOAN APPROVAL WORKFLOW TEST PASSED![/bold green]")
-    else:
-        rprint("[bold yellow]⚠️  LOAN APPROVAL WORKFLOW TEST COMPLETED WITH WARNINGS[/bold yellow]")
-    rprint("=" * 80)
+    # One print (one markup parse and flush) for the whole summary
+    rprint("\n".join([
+        "=" * 80,
+        "[bold]📊 LOAN APPROVAL SUMMARY[/bold]",
+        "=" * 80,
+        "",
+        f"[bold]Borrower:[/bold] Charlie ({addr[:10]}...)",
+        f"  • ERC-8004 Score: {score}",
+        f"  • Stake: ${stake} USDC",
+        f"  • Requested: ${amt} USDC",
+        "",
+        "[bold]Alice's Evaluation:[/bold]",
+        f"  • Decision: {alice_evaluation['decision']}",
+        f"  • Risk Score: {alice_evaluation['risk_score']}/100",
+        f"  • Max Approved: ${alice_evaluation.get('max_loan_amount')} USDC",
+        "  • Service Fee: 0.001 A0GI",
+        "",
+        "[bold]Bob's Audit:[/bold]",
+        f"  • Audit Decision: {bob_audit.get('audit_decision')}",
+        f"  • Agrees with Alice: {bob_audit.get('agrees_with_alice')}",
+        f"  • Compliance: {bob_audit.get('compliance_check')}",
+        "  • Service Fee: 0.001 A0GI",
+        "",
+        "[bold]Deterministic Verification:[/bold]",
+        *verification,
+        "",
+        "[bold]Payment Flow (if approved):[/bold]",
+        "  • Loan: 0.5 USDC via x402 → Charlie",
+        "  • Alice fee: 0.001 A0GI (0G network)",
+        "  • Bob fee: 0.001 A0GI (0G network)",
+        "",
+        "[bold]Evidence Storage:[/bold]",
+        "  • All proofs published to 0G Storage",
+        "  • Payment tx linked to proof CIDs",
+        "  • Fully auditable and accountable",
+        "",
+        "=" * 80,
+        outcome,
+        "=" * 80,
+    ]))
 
 
 if __name__ == "__main__":